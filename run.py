@@ -11,7 +11,7 @@ from pathlib import Path
 from typing import Dict, List
 
 from src.graph.database import Database
-from src.config import DB_PATH, DEFAULT_URLS, CACHE_DIR, PDF_DIR, CHROMA_COLLECTION, FACTORY_CAREER_URL
+from src.config import DB_PATH, DEFAULT_URLS, CACHE_DIR, PDF_DIR, CHROMA_COLLECTION, FACTORY_CAREER_URL, DATA_VERSION_PATH
 
 logging.basicConfig(
     level=logging.INFO,
@@ -81,7 +81,7 @@ class EnhancedPipeline:
         # ✅ STEP 1B: Scrape Career Page (CRITICAL for Query 3)
         logger.info("👔 Scraping Factory Jobs...")
         try:
-            jobs = self.selenium_scraper.scrape_jobs(url=FACTORY_CAREER_URL)
+            jobs = self.selenium_scraper.scrape_jobs(url=FACTORY_CAREER_URL, use_cache=use_cache)
             
             if jobs:
                 # Convert to standard format
@@ -101,6 +101,8 @@ class EnhancedPipeline:
                 logger.warning("⚠️ No jobs from career page")
         except Exception as e:
             logger.error(f"❌ Career page scraping failed: {e}")
+        finally:
+            self.selenium_scraper.close()
 
         # ✅ STEP 1C: Scrape PDFs (CRITICAL for Query 2)
         pdf_files = list(PDF_DIR.glob("*.pdf"))
@@ -289,6 +291,9 @@ class EnhancedPipeline:
             print()
             self.step4_vector_indexing(scraped_data)
 
+            # New data: invalidate the UI's persisted preset results
+            DATA_VERSION_PATH.write_text(datetime.now().isoformat())
+
             elapsed = (datetime.now() - start_time).total_seconds()
 
             logger.info("")
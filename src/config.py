@@ -19,6 +19,9 @@ for d in [DATA_DIR, CACHE_DIR, VECTOR_STORE_DIR, PDF_DIR]:
 # Database
 DB_PATH = str(BASE_DIR / "motherson_graph.db")
 
+# Written at the end of each ingestion run; keys the app's persisted query caches
+DATA_VERSION_PATH = DATA_DIR / "data_version.txt"
+
 # API Keys
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
 
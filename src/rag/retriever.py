@@ -3,7 +3,7 @@
 # ==================================================
 
 import logging
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import chromadb
 from chromadb.config import Settings
 from pathlib import Path
@@ -151,6 +151,30 @@ class Retriever:
         logger.info(f"Retrieved {len(results)} results from graph")
         return results
 
+    def _graph_query_key(self, query_type: str, filters: Dict) -> Tuple:
+        """The filter values a graph query actually depends on"""
+        if query_type == 'list_facilities':
+            return (query_type, filters.get('division'), filters.get('state'), filters.get('status'))
+        if query_type == 'new_expansions':
+            return (query_type, filters.get('date_from'), filters.get('date_to'))
+        return (query_type,)
+
+    def retrieve_from_graph_batch(self, requests: List[Tuple[str, Dict]]) -> List[List[Dict]]:
+        """Run several (query_type, filters) graph queries in one call, results in order.
+        Requests that differ only in filters their query ignores share one database lookup"""
+        fetched = {}
+        batch = []
+        for query_type, filters in requests:
+            key = self._graph_query_key(query_type, filters)
+            if key not in fetched:
+                fetched[key] = self.retrieve_from_graph(query_type, filters)
+            batch.append(list(fetched[key]))
+        return batch
+
+    def retrieve_from_graph_multi(self, query_type: str, filters_list: List[Dict]) -> List[List[Dict]]:
+        """Run one query type over several filter combinations, results in order"""
+        return self.retrieve_from_graph_batch([(query_type, filters) for filters in filters_list])
+
     def retrieve_from_vector(self, query: str, n_results: int = 5) -> List[Dict]:
         try:
             if self.collection.count() == 0:
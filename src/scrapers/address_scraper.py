@@ -60,6 +60,10 @@ class AddressScraper:
             'Hyderabad': 'Telangana',
             'Kolkata': 'West Bengal'
         }
+        
+        # (header cells, column layout) of the last successfully parsed table;
+        # later tables with the same header row skip column discovery
+        self._schema = None
     
     def scrape_all(self, pages: int = 19, use_cache: bool = True) -> List[Dict]:
         """Scrape all address-directory pages"""
@@ -142,66 +146,98 @@ class AddressScraper:
     
     def _parse_table(self, table) -> List[Dict]:
         """Parse table structure"""
-        results = []
         rows = table.find_all("tr")
         
         if len(rows) < 2:
-            return results
+            return []
         
         # Try to identify header
         header = rows[0]
         header_cells = [cell.get_text(strip=True).lower() for cell in header.find_all(["th", "td"])]
         
+        # Reuse the cached column layout only for the same header row
+        if self._schema is not None and self._schema[0] == header_cells:
+            return self._parse_table_fixed(rows, self._schema[1])
+        
         # Find column indices
-        name_col = self._find_col_index(header_cells, ['name', 'facility', 'company', 'location'])
-        city_col = self._find_col_index(header_cells, ['city', 'location', 'place'])
-        state_col = self._find_col_index(header_cells, ['state', 'region'])
-        address_col = self._find_col_index(header_cells, ['address', 'street'])
+        schema = {
+            'name_col': self._find_col_index(header_cells, ['name', 'facility', 'company', 'location']),
+            'city_col': self._find_col_index(header_cells, ['city', 'location', 'place']),
+            'state_col': self._find_col_index(header_cells, ['state', 'region']),
+            'address_col': self._find_col_index(header_cells, ['address', 'street']),
+        }
+        
+        results = self._parse_table_fixed(rows, schema)
+        if results:
+            self._schema = (header_cells, schema)
+        
+        return results
+    
+    def _parse_table_fixed(self, rows, schema: Dict) -> List[Dict]:
+        """Parse data rows using a known column layout (no header inspection)"""
+        results = []
+        extract_row = self._build_row_extractor(schema)
         
-        # Parse data rows
         for row in rows[1:]:
             cells = row.find_all(["td", "th"])
             if len(cells) < 2:
                 continue
             
-            cell_texts = [cell.get_text(strip=True) for cell in cells]
+            facility = extract_row([cell.get_text(strip=True) for cell in cells])
+            if facility:
+                results.append(facility)
+        
+        return results
+    
+    def _build_row_extractor(self, schema: Dict):
+        """Specialize a row extractor to the given column indices"""
+        name_col = schema.get('name_col')
+        city_col = schema.get('city_col')
+        state_col = schema.get('state_col')
+        address_col = schema.get('address_col')
+        
+        # Unknown columns become -1 so the bounds checks below always fail
+        name_col = -1 if name_col is None else name_col
+        city_col = -1 if city_col is None else city_col
+        state_col = -1 if state_col is None else state_col
+        address_col = -1 if address_col is None else address_col
+        
+        city_to_state = self.city_to_state
+        split_location = self._split_location
+        map_division = self._map_division
+        
+        def extract_row(cell_texts: List[str]) -> Optional[Dict]:
+            n = len(cell_texts)
             
             # Extract name
-            name = None
-            if name_col is not None and name_col < len(cell_texts):
+            if 0 <= name_col < n:
                 name = cell_texts[name_col]
-            elif len(cell_texts) > 0:
-                name = cell_texts[0]
+            else:
+                name = cell_texts[0] if n else None
             
             if not name or len(name) < 3:
-                continue
+                return None
             
             # Extract location
             city = None
             state = None
             
-            if city_col is not None and city_col < len(cell_texts):
-                location_text = cell_texts[city_col]
-                city, state = self._split_location(location_text)
+            if 0 <= city_col < n:
+                city, state = split_location(cell_texts[city_col])
             
-            if state_col is not None and state_col < len(cell_texts):
+            if 0 <= state_col < n:
                 state = cell_texts[state_col]
             
             # Extract address
-            address = None
-            if address_col is not None and address_col < len(cell_texts):
-                address = cell_texts[address_col]
+            address = cell_texts[address_col] if 0 <= address_col < n else None
             
             # Infer state from city
             if city and not state:
-                state = self.city_to_state.get(city)
+                state = city_to_state.get(city)
             
-            # Map division
-            division = self._map_division(name)
-            
-            results.append({
+            return {
                 "name": name,
-                "division": division,
+                "division": map_division(name),
                 "city": city,
                 "state": state,
                 "address": address,
@@ -209,9 +245,9 @@ class AddressScraper:
                 "status": "operational",
                 "source": "address_directory",
                 "date": None
-            })
+            }
         
-        return results
+        return extract_row
     
     def _parse_card(self, card) -> Optional[Dict]:
         """Parse card/div structure"""
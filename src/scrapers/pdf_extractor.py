@@ -3,16 +3,170 @@ Enhanced PDF Extractor - CRITICAL FIX FOR QUERY 2
 Now extracts expansion/greenfield data from MSWIL Annual Report
 """
 import logging
+import os
+import queue
 import re
+import sys
+import threading
 from datetime import datetime
-from typing import Dict, Optional, List
+from functools import lru_cache
+from typing import Dict, Optional, List, Tuple
 from io import BytesIO
+from concurrent.futures import ProcessPoolExecutor
 import pdfplumber
 
+try:
+    import re2  # Optional: google-re2 linear-time (DFA) regex engine
+except ImportError:
+    re2 = None
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _compile(pattern: str, flags: int = 0):
+    """Compile with RE2 when installed; fall back to re if RE2 rejects the pattern"""
+    if re2 is not None and not flags & ~re.IGNORECASE:
+        try:
+            return re2.compile(f'(?i){pattern}' if flags & re.IGNORECASE else pattern)
+        except Exception:
+            pass
+    return re.compile(pattern, flags)
+
+
+# Pre-compiled patterns (avoid per-call lookups in the re module cache)
+# Expansion patterns, in the order they are tried on each page. Kept separate
+# (not one alternation) so overlapping matches are all found and expansions
+# come out page by page, pattern by pattern (_merge_expansion_data keeps the
+# last timeline per city, so the order decides the winner).
+# Patterns are lowercase and run against lowercased text (no IGNORECASE);
+# match spans index back into the original text.
+_PAT_EXPANSIONS = (
+    # p1: "establishing X new plants in Y"
+    ('p1', _compile(r'establishing\s+(?P<p1_count>\w+)\s+new\s+plants?\s+in\s+(?P<p1_locations>\w+(?:\s+\([^)]+\))?(?:\s+and\s+\w+(?:\s+\([^)]+\))?)?)')),
+    # p2: "new plant in City"
+    ('p2', _compile(r'new\s+(?:plant|facility|unit)\s+in\s+\w+')),
+    # p3: "City plant... operations in FY"
+    ('p3', _compile(r'\w+\s+plant[^.]*(?:commence|start|begin)\s+operations\s+in\s+(?:fy\s*\d{4}[-–]\d{2,4}|q\d\s+\d{4}|\d{4})')),
+    # p4: "greenfield/brownfield in City"
+    ('p4', _compile(r'(?:greenfield|brownfield)[^.]*in\s+\w+')),
+    # p5: Specific MSWIL expansion text
+    ('p5', _compile(r'two\s+new\s+plants\s+in\s+[^.]+\s+equipped\s+to\s+manufacture')),
+)
+
+# Cheap prefilter: every expansion branch needs one of these words, so pages
+# without a hit can skip the full expansion scan
+_PAT_EXPANSION_TRIGGER = _compile(r'plant|new\s+(?:facility|unit)|greenfield|brownfield', re.IGNORECASE)
+
+# Timeline patterns
+_PAT_FY_RANGE = _compile(r'FY\s*(\d{4})[-–](\d{2,4})', re.IGNORECASE)
+_PAT_QUARTER_YEAR = _compile(r'Q(\d)\s+(\d{4})', re.IGNORECASE)
+_PAT_COMMENCE = _compile(r'(expected to|will|planned to)\s+commence\s+operations\s+in\s+(FY\s*\d{4}[-–]\d{2,4})', re.IGNORECASE)
+_PAT_OPERATIONAL_BY = _compile(r'operational\s+(?:by|in)\s+(FY\s*\d{4}[-–]\d{2,4}|Q\d\s+\d{4}|\d{4})', re.IGNORECASE)
+_PAT_YEAR_RANGE = _compile(r'(\d{4})[-–](\d{2,4})')
+_PAT_TIMELINES = [_PAT_FY_RANGE, _PAT_QUARTER_YEAR, _PAT_COMMENCE, _PAT_OPERATIONAL_BY, _PAT_YEAR_RANGE]
+
+# Date pattern: FY year | quarter + year | bare 20XX year, in one alternation
+_PAT_DATE = _compile(r'FY\s*(\d{4})|Q([1-4])\s+(\d{4})|\b(20\d{2})\b', re.IGNORECASE)
+
+# Latest plausible year for a bare "20XX" date (computed once at import)
+_MAX_YEAR = datetime.now().year + 5
+
+# Pre-formatted fiscal-year-end dates for the common range
+_FY_DATES = {str(year): f"{year}-03-31" for year in range(2010, _MAX_YEAR + 1)}
+
+# Column index used for "not present" in table parsing (never < len(row))
+_NO_COLUMN = sys.maxsize
+
+# Misc
+_PAT_LOC_PARENS = _compile(r'(\w+)\s*\(([^)]+)\)')
+
+
+def _lower_aligned(text: str) -> str:
+    """Lowercase text while keeping character offsets aligned with the original"""
+    text_lower = text.lower()
+    if len(text_lower) != len(text):
+        # A few non-ASCII characters grow when lowercased; leave those as-is
+        text_lower = ''.join(c if len(c.lower()) != 1 else c.lower() for c in text)
+    return text_lower
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern short repeated strings (city/state/division) so rows share one object"""
+    return sys.intern(value) if value else value
+
+
+def _build_classifier(rules: List[tuple]) -> tuple:
+    """
+    Compile (category, keywords) rules, highest priority first, into one
+    keyword regex plus a keyword -> rank lookup
+    """
+    ranks = {}
+    categories = []
+    for rank, (category, keywords) in enumerate(rules):
+        categories.append(category)
+        for kw in keywords:
+            ranks.setdefault(kw.lower(), rank)
+    
+    # Zero-width lookahead so overlapping keywords are all reported
+    # (plain re: RE2 has no lookaround)
+    alternation = '|'.join(re.escape(kw) for kw in ranks)
+    return re.compile(f'(?=({alternation}))'), ranks, categories
+
+
+def _classify(classifier: tuple, text_lower: str, default=None):
+    """Return the highest-priority category whose keyword occurs in text_lower"""
+    pattern, ranks, categories = classifier
+    rank = min((ranks[kw] for kw in pattern.findall(text_lower)), default=None)
+    return default if rank is None else categories[rank]
+
+
+class FacilityColumns:
+    """
+    Column-oriented (struct-of-arrays) facility store: one list per field
+    instead of one dict per facility. Rows are only materialized as dicts
+    by to_records() at the API boundary.
+    """
+    
+    COLUMNS = ('name', 'division', 'city', 'state', 'status', 'expansion_type',
+               'timeline', 'date', 'page', 'source_type')
+    
+    def __init__(self):
+        self.cols = {col: [] for col in self.COLUMNS}
+    
+    def __len__(self) -> int:
+        return len(self.cols['name'])
+    
+    def append(self, record: Dict):
+        """Append one facility dict; missing fields become None"""
+        for col, values in self.cols.items():
+            values.append(record.get(col))
+    
+    def extend(self, records: List[Dict]):
+        for record in records:
+            self.append(record)
+    
+    def to_records(self) -> List[Dict]:
+        """Zip columns back into a list of facility dicts"""
+        names = self.COLUMNS
+        return [dict(zip(names, row)) for row in zip(*(self.cols[col] for col in names))]
+
+
+# Per-process extractor used by PDFExtractor.extract_many workers
+_worker_extractor = None
+
+
+def _init_worker():
+    """Build one PDFExtractor per worker process (compiled patterns are reused)"""
+    global _worker_extractor
+    _worker_extractor = PDFExtractor()
+
+
+def _extract_in_worker(item: Tuple[bytes, str]) -> Optional[Dict]:
+    pdf_content, url = item
+    return _worker_extractor.extract_from_bytes(pdf_content, url)
+
+
 class PDFExtractor:
     def __init__(self):
         # Division mapping
@@ -44,6 +198,55 @@ class PDFExtractor:
             'Hyderabad': 'Telangana', 'Kolkata': 'West Bengal'
         }
         
+        # Every extracted row reuses these values; keep a single copy of each
+        self.division_map = {_intern(k): _intern(v) for k, v in self.division_map.items()}
+        self.city_to_state = {_intern(k): _intern(v) for k, v in self.city_to_state.items()}
+        
+        # Single-pass city scanner: one alternation over lowercased city names
+        # (longest first) instead of one substring test per city
+        self._city_lookup = {city.lower(): city for city in self.city_to_state}
+        cities_alt = '|'.join(re.escape(c) for c in sorted(self._city_lookup, key=len, reverse=True))
+        self._city_pattern = _compile(cities_alt)
+        self._city_rank = {city: rank for rank, city in enumerate(self.city_to_state)}
+        
+        # Inline facility patterns, built from city_to_state so the city group
+        # yields the canonical name directly. Kept separate (not one alternation):
+        # their matches overlap ("Sanand plant in Pune"), and a single finditer
+        # would report only one of them
+        self._pats_inline = tuple(_compile(p) for p in (
+            rf'\b(?P<city>{cities_alt})\s+(?:plant|facility|unit|manufacturing|operations|factory)\b',
+            rf'\b(?:mswil|smr|smp|pkc)\s+(?P<city>{cities_alt})\b',
+            rf'\b(?:plant|facility|unit|manufacturing|operations)\s+(?:in|at|located in|located at)\s+(?P<city>{cities_alt})'
+        ))
+        
+        # Keyword classifiers (one regex scan + rank lookup per call)
+        self._division_classifier = _build_classifier(
+            [(full_name, [abbr]) for abbr, full_name in self.division_map.items()]
+        )
+        self._division_fallback_classifier = _build_classifier(
+            [(full_name, [abbr]) for abbr, full_name in self.division_map.items()] + [
+                ('Wiring Systems', ['WIRING', 'HARNESS']),
+                ('Vision Systems', ['VISION', 'MIRROR']),
+                ('Polymers', ['POLYMER']),
+                ('Seating Systems', ['SEATING']),
+                ('Logistics', ['LOGISTIC']),
+            ]
+        )
+        self._status_text_classifier = _build_classifier([
+            ('planned', ['expected to commence', 'will commence', 'planned', 'upcoming', 'proposed']),
+            ('under-construction', ['under construction', 'being established', 'setting up']),
+            ('operational', ['operational', 'commenced', 'inaugurated']),
+        ])
+        self._status_context_classifier = _build_classifier([
+            ('planned', ['planned', 'proposed', 'upcoming', 'future', 'announced', 'expected to commence']),
+            ('under-construction', ['construction', 'building', 'under development', 'establishing']),
+            ('operational', ['operational', 'operating', 'commissioned', 'inaugurated']),
+        ])
+        self._status_cell_classifier = _build_classifier([
+            ('planned', ['plan', 'propos', 'upcom', 'futur', 'announc']),
+            ('under-construction', ['construction', 'building', 'develop']),
+        ])
+        
         # CRITICAL: Expansion keywords for Query 2
         self.expansion_keywords = [
             'new plant', 'new facility', 'greenfield', 'brownfield',
@@ -56,26 +259,28 @@ class PDFExtractor:
         """Extract comprehensive data from PDF with EXPANSION FOCUS"""
         try:
             full_text = []
-            facilities = []
-            expansions = []  # NEW: Track expansion-specific data
+            full_lower = []  # Lowercased full_text parts, offsets aligned
+            facilities = FacilityColumns()
+            expansions = []
             
             with pdfplumber.open(BytesIO(pdf_content)) as pdf:
                 # Extract metadata
                 metadata = pdf.metadata or {}
                 title = metadata.get('Title', url)
                 
-                for page_num, page in enumerate(pdf.pages, 1):
-                    # Extract text
-                    page_text = page.extract_text()
+                for page_num, page_text, tables in self._iter_pages(pdf):
                     if page_text:
-                        full_text.append(f"[Page {page_num}]\n{page_text}")
+                        page_lower = _lower_aligned(page_text)
                         
-                        # CRITICAL: Extract expansion mentions from text
-                        page_expansions = self._extract_expansions_from_text(page_text, page_num)
-                        expansions.extend(page_expansions)
+                        # CRITICAL: Extract expansion mentions while the
+                        # producer thread parses the next pages' layout
+                        expansions.extend(self._extract_expansions_from_text(page_text, page_num, page_lower))
+                        
+                        page_header = f"[Page {page_num}]\n"
+                        full_text.append(f"{page_header}{page_text}")
+                        full_lower.append(f"{page_header.lower()}{page_lower}")
                     
-                    # Extract tables
-                    tables = page.extract_tables()
+                    # Parse tables
                     if tables:
                         for table_idx, table in enumerate(tables):
                             table_facilities = self._parse_facility_table(table, page_num)
@@ -84,6 +289,7 @@ class PDFExtractor:
                             # Add table to text
                             table_text = self._table_to_text(table)
                             full_text.append(f"\n[Table {table_idx+1} on Page {page_num}]\n{table_text}")
+                            full_lower.append(_lower_aligned(full_text[-1]))
                 
                 # Parse creation date
                 creation_date = metadata.get('CreationDate')
@@ -97,32 +303,35 @@ class PDFExtractor:
                         pass
                 
                 combined_text = '\n\n'.join(full_text)
+                combined_lower = '\n\n'.join(full_lower)
                 
-                # Extract inline facilities
-                inline_facilities = self._extract_inline_facilities(combined_text)
+                # Extract inline facilities (whole document: their context
+                # windows reach across page boundaries)
+                inline_facilities = self._extract_inline_facilities(combined_text, combined_lower)
                 facilities.extend(inline_facilities)
                 
                 # CRITICAL: Merge expansion data with facilities
-                facilities = self._merge_expansion_data(facilities, expansions)
+                facilities = self._merge_expansion_data(facilities, expansions).to_records()
                 
-                # Add structured data to text
+                # Add structured data to text (collected as parts, joined once)
                 if facilities:
-                    combined_text += "\n\n=== EXTRACTED FACILITIES ===\n"
+                    text_parts = [combined_text, "\n\n=== EXTRACTED FACILITIES ===\n"]
                     for fac in facilities:
-                        combined_text += f"Facility: {fac['name']}\n"
-                        combined_text += f"  Division: {fac.get('division', 'Unknown')}\n"
-                        combined_text += f"  Location: {fac.get('city', 'N/A')}, {fac.get('state', 'N/A')}\n"
-                        combined_text += f"  Status: {fac.get('status', 'operational')}\n"
+                        text_parts.append(f"Facility: {fac['name']}\n")
+                        text_parts.append(f"  Division: {fac.get('division', 'Unknown')}\n")
+                        text_parts.append(f"  Location: {fac.get('city', 'N/A')}, {fac.get('state', 'N/A')}\n")
+                        text_parts.append(f"  Status: {fac.get('status', 'operational')}\n")
                         
                         # CRITICAL: Add expansion info
                         if fac.get('expansion_type'):
-                            combined_text += f"  Expansion Type: {fac['expansion_type']}\n"
+                            text_parts.append(f"  Expansion Type: {fac['expansion_type']}\n")
                         if fac.get('date'):
-                            combined_text += f"  Date: {fac['date']}\n"
+                            text_parts.append(f"  Date: {fac['date']}\n")
                         if fac.get('timeline'):
-                            combined_text += f"  Timeline: {fac['timeline']}\n"
+                            text_parts.append(f"  Timeline: {fac['timeline']}\n")
                         
-                        combined_text += "\n"
+                        text_parts.append("\n")
+                    combined_text = ''.join(text_parts)
                 
                 return {
                     'url': url,
@@ -134,78 +343,127 @@ class PDFExtractor:
                     'structured_facilities': facilities
                 }
             
-        except Exception as e:
-            logger.error(f"PDF extraction error: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception(f"PDF extraction error for {url}")
             return None
     
-    def _extract_expansions_from_text(self, text: str, page_num: int) -> List[Dict]:
-        """CRITICAL: Extract expansion/greenfield mentions from text"""
-        expansions = []
-        
-        # Pattern 1: "establishing X new plants in Y"
-        pattern1 = r'establishing\s+(\w+)\s+new\s+plants?\s+in\s+(\w+(?:\s+\([^)]+\))?(?:\s+and\s+\w+(?:\s+\([^)]+\))?)?)'
-        
-        # Pattern 2: "new plant in City"
-        pattern2 = r'new\s+(?:plant|facility|unit)\s+in\s+(\w+)'
-        
-        # Pattern 3: "City plant... operations in FY"
-        pattern3 = r'(\w+)\s+plant[^.]*(?:commence|start|begin)\s+operations\s+in\s+(FY\s*\d{4}[-–]\d{2,4}|Q\d\s+\d{4}|\d{4})'
-        
-        # Pattern 4: "greenfield/brownfield in City"
-        pattern4 = r'(greenfield|brownfield)[^.]*in\s+(\w+)'
+    def _iter_pages(self, pdf, prefetch: int = 8):
+        """
+        Yield (page_num, page_text, tables) in page order.
+        A background thread extracts pages into a bounded queue so layout
+        parsing overlaps with the regex work done by the consumer.
+        """
+        buffer = queue.Queue(maxsize=prefetch)
+        stop = threading.Event()
+        done = object()
+        
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    buffer.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
         
-        # Pattern 5: Specific MSWIL expansion text
-        pattern5 = r'two\s+new\s+plants\s+in\s+([^.]+)\s+equipped\s+to\s+manufacture'
+        def produce():
+            try:
+                # pdfplumber pages share one document stream, so a single
+                # producer extracts them sequentially
+                for page_num, page in enumerate(pdf.pages, 1):
+                    # One table-finding pass; extract_text() reuses the page's
+                    # cached char objects instead of re-parsing the layout
+                    layout = page.find_tables()
+                    page_text = page.extract_text()
+                    tables = [table.extract() for table in layout]
+                    if not put((page_num, page_text, tables)):
+                        return
+            except Exception as e:
+                put(e)
+                return
+            put(done)
         
-        all_patterns = [pattern1, pattern2, pattern3, pattern4, pattern5]
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
         
-        for pattern in all_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                # Extract location and timeline
-                matched_text = match.group(0)
-                
-                # Try to find cities
-                cities = []
-                for city in self.city_to_state.keys():
-                    if city.lower() in matched_text.lower():
-                        cities.append(city)
-                
-                # If pattern1, extract from groups
-                if pattern == pattern1:
-                    try:
-                        count = match.group(1)
-                        locations = match.group(2)
-                        
-                        # Parse "Navagam (Gujarat) and Pune (Maharashtra)"
-                        location_parts = re.findall(r'(\w+)\s*\(([^)]+)\)', locations)
-                        if location_parts:
-                            for city, state in location_parts:
-                                cities.append(city)
-                    except:
-                        pass
-                
-                # Extract timeline
-                timeline = self._extract_timeline_from_context(text, match.start(), match.end())
-                
-                # Create expansion entries
-                if cities:
-                    for city in cities:
-                        state = self.city_to_state.get(city)
-                        expansions.append({
-                            'city': city,
-                            'state': state,
-                            'expansion_type': 'greenfield' if 'greenfield' in matched_text.lower() or 'new plant' in matched_text.lower() else 'brownfield',
-                            'status': self._infer_status_from_text(matched_text),
-                            'timeline': timeline,
-                            'page': page_num,
-                            'context': matched_text
-                        })
-                        logger.info(f"  🔍 Found expansion: {city}, {state} - {timeline}")
+        try:
+            while True:
+                item = buffer.get()
+                if item is done:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            producer.join()
+    
+    def _extract_expansions_from_text(self, text: str, page_num: int, text_lower: str = None) -> List[Dict]:
+        """CRITICAL: Extract expansion/greenfield mentions from one page's text"""
+        expansions = []
+        if text_lower is None:
+            text_lower = _lower_aligned(text)
+        
+        # Pages without any trigger word cannot match an expansion pattern
+        if not _PAT_EXPANSION_TRIGGER.search(text_lower):
+            return expansions
+        
+        matches = (
+            (name, match)
+            for name, pattern in _PAT_EXPANSIONS
+            for match in pattern.finditer(text_lower)
+        )
+        
+        for name, match in matches:
+            # Extract location and timeline
+            matched_lower = match.group(0)
+            matched_text = text[match.start():match.end()]
+            
+            # Try to find cities
+            cities = self._find_cities(matched_lower)
+            
+            # If pattern1, extract from groups
+            if name == 'p1':
+                try:
+                    count = match.group('p1_count')
+                    locations = text[match.start('p1_locations'):match.end('p1_locations')]
+                    
+                    # Parse "Navagam (Gujarat) and Pune (Maharashtra)"
+                    location_parts = _PAT_LOC_PARENS.findall(locations)
+                    if location_parts:
+                        for city, state in location_parts:
+                            cities.append(_intern(city))
+                except:
+                    pass
+            
+            # Extract timeline
+            timeline = self._extract_timeline_from_context(text, match.start(), match.end())
+            
+            # Create expansion entries
+            if cities:
+                expansion_type = 'greenfield' if 'greenfield' in matched_lower or 'new plant' in matched_lower else 'brownfield'
+                status = self._infer_status_from_text(matched_lower)
+                for city in cities:
+                    state = self.city_to_state.get(city)
+                    expansions.append({
+                        'city': city,
+                        'state': state,
+                        'expansion_type': expansion_type,
+                        'status': status,
+                        'timeline': timeline,
+                        'page': page_num,
+                        'context': matched_text
+                    })
+                    logger.info(f"  🔍 Found expansion: {city}, {state} - {timeline}")
         
         return expansions
     
+    def _find_cities(self, text_lower: str) -> List[str]:
+        """Find known cities in lowercased text (unique, in city_to_state order)"""
+        lookup = self._city_lookup
+        found = {lookup[m.group(0)] for m in self._city_pattern.finditer(text_lower)}
+        return sorted(found, key=self._city_rank.__getitem__)
+    
     def _extract_timeline_from_context(self, text: str, start: int, end: int) -> Optional[str]:
         """Extract timeline from surrounding context"""
         # Get context window
@@ -213,36 +471,18 @@ class PDFExtractor:
         context_end = min(len(text), end + 500)
         context = text[context_start:context_end]
         
-        # Timeline patterns
-        patterns = [
-            r'FY\s*(\d{4})[-–](\d{2,4})',
-            r'Q(\d)\s+(\d{4})',
-            r'(expected to|will|planned to)\s+commence\s+operations\s+in\s+(FY\s*\d{4}[-–]\d{2,4})',
-            r'operational\s+(?:by|in)\s+(FY\s*\d{4}[-–]\d{2,4}|Q\d\s+\d{4}|\d{4})',
-            r'(\d{4})[-–](\d{2,4})'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, context, re.IGNORECASE)
+        for pattern in _PAT_TIMELINES:
+            match = pattern.search(context)
             if match:
                 return match.group(0)
         
         return None
     
-    def _infer_status_from_text(self, text: str) -> str:
-        """Infer facility status from text"""
-        text_lower = text.lower()
-        
-        if any(kw in text_lower for kw in ['expected to commence', 'will commence', 'planned', 'upcoming', 'proposed']):
-            return 'planned'
-        elif any(kw in text_lower for kw in ['under construction', 'being established', 'setting up']):
-            return 'under-construction'
-        elif any(kw in text_lower for kw in ['operational', 'commenced', 'inaugurated']):
-            return 'operational'
-        
-        return 'planned'
+    def _infer_status_from_text(self, text_lower: str) -> str:
+        """Infer facility status from already-lowercased text"""
+        return _classify(self._status_text_classifier, text_lower, 'planned')
     
-    def _merge_expansion_data(self, facilities: List[Dict], expansions: List[Dict]) -> List[Dict]:
+    def _merge_expansion_data(self, facilities: FacilityColumns, expansions: List[Dict]) -> FacilityColumns:
         """Merge expansion data into facilities"""
         # Create map of cities to expansion data
         expansion_map = {}
@@ -252,30 +492,34 @@ class PDFExtractor:
                 if city not in expansion_map or exp.get('timeline'):
                     expansion_map[city] = exp
         
+        cols = facilities.cols
+        expansion_types = cols['expansion_type']
+        timelines = cols['timeline']
+        statuses = cols['status']
+        
         # Merge into facilities
-        for fac in facilities:
-            city = fac.get('city')
+        for idx, city in enumerate(cols['city']):
             if city and city in expansion_map:
                 exp = expansion_map[city]
                 
                 # Add expansion info if not already present
-                if not fac.get('expansion_type'):
-                    fac['expansion_type'] = exp.get('expansion_type')
-                if not fac.get('timeline'):
-                    fac['timeline'] = exp.get('timeline')
+                if not expansion_types[idx]:
+                    expansion_types[idx] = exp.get('expansion_type')
+                if not timelines[idx]:
+                    timelines[idx] = exp.get('timeline')
                 
                 # Update status if expansion is more specific
                 if exp.get('status') and exp['status'] != 'operational':
-                    fac['status'] = exp['status']
+                    statuses[idx] = exp['status']
         
         # Add standalone expansions that don't match existing facilities
+        existing_cities = set(cols['city'])
         for exp in expansions:
             city = exp.get('city')
             
             # Check if already in facilities
-            exists = any(f.get('city') == city for f in facilities)
-            
-            if not exists:
+            if city not in existing_cities:
+                existing_cities.add(city)
                 # Create new facility entry from expansion
                 facilities.append({
                     'name': f"{city} Plant",
@@ -303,35 +547,41 @@ class PDFExtractor:
         header = table[0]
         header_lower = [str(cell).lower() if cell else '' for cell in header]
         
-        # Find column indices
-        facility_col = self._find_column(header_lower, ['facility', 'plant', 'location', 'unit', 'site'])
-        division_col = self._find_column(header_lower, ['division', 'business', 'segment'])
-        city_col = self._find_column(header_lower, ['city', 'location', 'place'])
-        state_col = self._find_column(header_lower, ['state', 'region'])
-        status_col = self._find_column(header_lower, ['status', 'stage', 'phase'])
-        date_col = self._find_column(header_lower, ['date', 'year', 'commissioned', 'operational'])
+        # Find column indices (missing columns are _NO_COLUMN, which is never < len(row))
+        facility_col, division_col, city_col, state_col, status_col, date_col = \
+            self._detect_columns(tuple(header_lower))
+        
+        # Without a name column no row can produce a facility
+        if facility_col == _NO_COLUMN:
+            return facilities
         
         # Parse data rows
         for row_idx, row in enumerate(table[1:], 1):
-            if not row or len(row) < 2:
+            if not row:
+                continue
+            row_len = len(row)
+            if row_len < 2 or facility_col >= row_len:
+                continue
+            
+            # Fail fast on empty/short name cells before any cleanup work
+            raw_name = row[facility_col]
+            if raw_name is None or len(str(raw_name)) < 3:
                 continue
             
             facility_data = {}
             
             # Extract facility name
-            facility_name = None
-            if facility_col is not None and facility_col < len(row):
-                facility_name = self._clean_cell(row[facility_col])
+            facility_name = self._clean_cell(raw_name)
             
-            if not facility_name or len(facility_name) < 3:
+            if len(facility_name) < 3:
                 continue
             
             facility_data['name'] = facility_name
             
             # Extract division
-            if division_col is not None and division_col < len(row):
+            if division_col < row_len:
                 division = self._clean_cell(row[division_col])
-                facility_data['division'] = self._map_division(division)
+                facility_data['division'] = _intern(self._map_division(division))
             else:
                 facility_data['division'] = self._infer_division(facility_name)
             
@@ -339,10 +589,10 @@ class PDFExtractor:
             city = None
             state = None
             
-            if city_col is not None and city_col < len(row):
+            if city_col < row_len:
                 city = self._clean_cell(row[city_col])
             
-            if state_col is not None and state_col < len(row):
+            if state_col < row_len:
                 state = self._clean_cell(row[state_col])
             
             # Parse combined location
@@ -356,18 +606,18 @@ class PDFExtractor:
             if city and not state and city in self.city_to_state:
                 state = self.city_to_state[city]
             
-            facility_data['city'] = city
-            facility_data['state'] = state
+            facility_data['city'] = _intern(city)
+            facility_data['state'] = _intern(state)
             
             # Extract status
-            if status_col is not None and status_col < len(row):
+            if status_col < row_len:
                 status = self._clean_cell(row[status_col])
                 facility_data['status'] = self._normalize_status(status)
             else:
                 facility_data['status'] = 'operational'
             
             # Extract date
-            if date_col is not None and date_col < len(row):
+            if date_col < row_len:
                 date_text = self._clean_cell(row[date_col])
                 facility_data['date'] = self._parse_date(date_text)
             
@@ -378,64 +628,57 @@ class PDFExtractor:
         
         return facilities
     
-    def _extract_inline_facilities(self, text: str) -> List[Dict]:
+    def _extract_inline_facilities(self, text: str, text_lower: str = None) -> List[Dict]:
         """Extract facilities from inline text"""
         facilities = []
+        if text_lower is None:
+            text_lower = _lower_aligned(text)
         
-        # Enhanced patterns
-        pattern1 = r'\b(Sanand|Hosur|Chakan|Manesar|Pune|Ahmedabad|Chennai|Bangalore|Bengaluru|Navagam|Bawal|Haridwar|Noida|Gurgaon|Gurugram|Hyderabad|Mumbai)\s+(Plant|Facility|Unit|Manufacturing|Operations|Factory)\b'
-        pattern2 = r'\b(MSWIL|SMR|SMP|PKC)\s+(Sanand|Hosur|Chakan|Manesar|Pune|Ahmedabad|Chennai|Bangalore|Bengaluru|Navagam|Bawal|Haridwar|Noida)\b'
-        pattern3 = r'\b(plant|facility|unit|manufacturing|operations)\s+(?:in|at|located in|located at)\s+(Sanand|Hosur|Chakan|Manesar|Pune|Ahmedabad|Chennai|Bangalore|Bengaluru|Navagam|Bawal|Haridwar|Noida|Gurgaon|Gurugram|Hyderabad|Mumbai)'
-        
-        all_patterns = [pattern1, pattern2, pattern3]
+        # Every inline pattern names a known city; bail out early if none appear
+        if not self._city_pattern.search(text_lower):
+            return facilities
         
-        for pattern in all_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                matched_text = match.group(0)
-                
-                # Extract city
-                city = None
-                for city_name in self.city_to_state.keys():
-                    if city_name.lower() in matched_text.lower():
-                        city = city_name
-                        break
-                
-                if not city:
-                    continue
-                
-                # Build facility name
-                if 'MSWIL' in matched_text.upper():
-                    facility_name = f"MSWIL {city} Plant"
-                elif 'SMR' in matched_text.upper():
-                    facility_name = f"SMR {city} Plant"
-                elif 'SMP' in matched_text.upper():
-                    facility_name = f"SMP {city} Plant"
-                else:
-                    facility_name = f"{city} Plant"
-                
-                # Infer division
-                division = self._infer_division(matched_text)
-                
-                # Get state
-                state = self.city_to_state.get(city)
-                
-                # Find nearby date and status
-                context_start = max(0, match.start() - 300)
-                context_end = min(len(text), match.end() + 300)
-                context = text[context_start:context_end]
-                
-                date = self._find_date_in_context(context)
-                status = self._find_status_in_context(context)
-                
-                facilities.append({
-                    'name': facility_name,
-                    'division': division,
-                    'city': city,
-                    'state': state,
-                    'status': status or 'operational',
-                    'date': date,
-                    'source_type': 'inline'
-                })
+        matches = (match for pattern in self._pats_inline for match in pattern.finditer(text_lower))
+        for match in matches:
+            matched_text = text[match.start():match.end()]
+            matched_lower = match.group(0)
+            
+            # Extract city
+            city = self._city_lookup[match.group('city')]
+            
+            # Build facility name
+            if 'mswil' in matched_lower:
+                facility_name = f"MSWIL {city} Plant"
+            elif 'smr' in matched_lower:
+                facility_name = f"SMR {city} Plant"
+            elif 'smp' in matched_lower:
+                facility_name = f"SMP {city} Plant"
+            else:
+                facility_name = f"{city} Plant"
+            
+            # Infer division
+            division = self._infer_division(matched_text)
+            
+            # Get state
+            state = self.city_to_state.get(city)
+            
+            # Find nearby date and status
+            context_start = max(0, match.start() - 300)
+            context_end = min(len(text), match.end() + 300)
+            context = text[context_start:context_end]
+            
+            date = self._find_date_in_context(context)
+            status = self._find_status_in_context(text_lower[context_start:context_end])
+            
+            facilities.append({
+                'name': facility_name,
+                'division': division,
+                'city': city,
+                'state': state,
+                'status': status or 'operational',
+                'date': date,
+                'source_type': 'inline'
+            })
         
         # Deduplicate
         unique_facilities = {}
@@ -446,7 +689,25 @@ class PDFExtractor:
         
         return list(unique_facilities.values())
     
-    def _find_column(self, header: List[str], keywords: List[str]) -> Optional[int]:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _detect_columns(header_lower: tuple) -> tuple:
+        """Column indices for a table header (memoized; reports repeat headers)"""
+        find = PDFExtractor._find_column
+        return tuple(
+            _NO_COLUMN if col is None else col
+            for col in (
+                find(header_lower, ['facility', 'plant', 'location', 'unit', 'site']),
+                find(header_lower, ['division', 'business', 'segment']),
+                find(header_lower, ['city', 'location', 'place']),
+                find(header_lower, ['state', 'region']),
+                find(header_lower, ['status', 'stage', 'phase']),
+                find(header_lower, ['date', 'year', 'commissioned', 'operational']),
+            )
+        )
+    
+    @staticmethod
+    def _find_column(header: List[str], keywords: List[str]) -> Optional[int]:
         """Find column index matching keywords"""
         for idx, cell in enumerate(header):
             if any(kw in cell for kw in keywords):
@@ -457,118 +718,70 @@ class PDFExtractor:
         """Clean table cell"""
         if cell is None:
             return ''
-        text = str(cell).strip()
-        text = re.sub(r'\s+', ' ', text)
-        return text
+        # split()/join collapses whitespace runs and strips the ends
+        return ' '.join(str(cell).split())
     
     def _map_division(self, division_text: str) -> str:
         """Map division abbreviations to full names"""
         if not division_text:
             return 'Unknown'
         
-        division_upper = division_text.upper()
-        
-        for abbr, full_name in self.division_map.items():
-            if abbr in division_upper:
-                return full_name
-        
-        if 'WIRING' in division_upper or 'HARNESS' in division_upper:
-            return 'Wiring Systems'
-        elif 'VISION' in division_upper or 'MIRROR' in division_upper:
-            return 'Vision Systems'
-        elif 'POLYMER' in division_upper:
-            return 'Polymers'
-        elif 'SEATING' in division_upper:
-            return 'Seating Systems'
-        elif 'LOGISTIC' in division_upper:
-            return 'Logistics'
-        
-        return division_text.title()
+        return _classify(self._division_fallback_classifier, division_text.lower()) or division_text.title()
     
     def _infer_division(self, text: str) -> str:
         """Infer division from text"""
-        text_upper = text.upper()
-        
-        for abbr, full_name in self.division_map.items():
-            if abbr in text_upper:
-                return full_name
-        
-        return 'Unknown'
+        return _classify(self._division_classifier, text.lower(), 'Unknown')
     
     def _normalize_status(self, status_text: str) -> str:
         """Normalize status"""
         if not status_text:
             return 'operational'
         
-        status_lower = status_text.lower()
-        
-        if any(kw in status_lower for kw in ['plan', 'propos', 'upcom', 'futur', 'announc']):
-            return 'planned'
-        elif any(kw in status_lower for kw in ['construction', 'building', 'develop']):
-            return 'under-construction'
-        else:
-            return 'operational'
+        return _classify(self._status_cell_classifier, status_text.lower(), 'operational')
     
-    def _parse_date(self, date_text: str) -> Optional[str]:
-        """Parse date from text"""
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_date(date_text: str) -> Optional[str]:
+        """Parse date from text (memoized; annual reports repeat the same dates)"""
         if not date_text:
             return None
         
-        try:
+        # One scan; FY beats quarter beats bare year, as in the original order
+        quarter = None
+        year = None
+        for match in _PAT_DATE.finditer(date_text):
+            fy_year, q_num, q_year, bare_year = match.groups()
+            
             # FY format
-            fy_match = re.search(r'FY\s*(\d{4})', date_text, re.IGNORECASE)
-            if fy_match:
-                year = fy_match.group(1)
-                return f"{year}-03-31"
-            
-            # Quarter format
-            q_match = re.search(r'Q([1-4])\s+(\d{4})', date_text, re.IGNORECASE)
-            if q_match:
-                quarter = int(q_match.group(1))
-                year = q_match.group(2)
-                month = quarter * 3
-                return f"{year}-{month:02d}-01"
-            
-            # Year only
-            year_match = re.search(r'\b(20\d{2})\b', date_text)
-            if year_match:
-                year = int(year_match.group(1))
-                if 2010 <= year <= datetime.now().year + 5:
-                    return f"{year}-01-01"
+            if fy_year is not None:
+                return _FY_DATES.get(fy_year) or f"{fy_year}-03-31"
             
-            return None
+            if q_num is not None:
+                if quarter is None:
+                    quarter = (int(q_num), q_year)
+            elif year is None:
+                year = bare_year
         
-        except Exception as e:
-            logger.warning(f"Date parsing failed for '{date_text}': {e}")
-            return None
-    
-    def _find_date_in_context(self, context: str) -> Optional[str]:
-        """Find date in surrounding context"""
-        date_patterns = [
-            r'FY\s*(\d{4})',
-            r'Q([1-4])\s+(\d{4})',
-            r'\b(20\d{2})\b'
-        ]
+        # Quarter format
+        if quarter:
+            q_num, q_year = quarter
+            return f"{q_year}-{q_num * 3:02d}-01"
         
-        for pattern in date_patterns:
-            match = re.search(pattern, context, re.IGNORECASE)
-            if match:
-                return self._parse_date(match.group(0))
+        # Year only
+        if year and 2010 <= int(year) <= _MAX_YEAR:
+            return f"{year}-01-01"
         
         return None
     
-    def _find_status_in_context(self, context: str) -> Optional[str]:
-        """Find status in surrounding context"""
-        context_lower = context.lower()
-        
-        if any(kw in context_lower for kw in ['planned', 'proposed', 'upcoming', 'future', 'announced', 'expected to commence']):
-            return 'planned'
-        elif any(kw in context_lower for kw in ['construction', 'building', 'under development', 'establishing']):
-            return 'under-construction'
-        elif any(kw in context_lower for kw in ['operational', 'operating', 'commissioned', 'inaugurated']):
-            return 'operational'
-        
-        return None
+    @staticmethod
+    def _find_date_in_context(context: str) -> Optional[str]:
+        """Find date in surrounding context"""
+        # Same FY > quarter > year precedence as _parse_date, so reuse it
+        return PDFExtractor._parse_date(context)
+    
+    def _find_status_in_context(self, context_lower: str) -> Optional[str]:
+        """Find status in already-lowercased surrounding context"""
+        return _classify(self._status_context_classifier, context_lower)
     
     def _table_to_text(self, table: List[List]) -> str:
         """Convert table to readable text"""
@@ -585,4 +798,18 @@ class PDFExtractor:
                 return self.extract_from_bytes(f.read(), filepath)
         except Exception as e:
             logger.error(f"File read error: {e}")
-            return None
\ No newline at end of file
+            return None
+    
+    @classmethod
+    def extract_many(cls, items: List[Tuple[bytes, str]], workers: int = None) -> List[Optional[Dict]]:
+        """Extract several PDFs in parallel processes; results keep input order"""
+        if not items:
+            return []
+        
+        workers = min(workers or os.cpu_count() or 1, len(items))
+        if workers == 1:
+            extractor = cls()
+            return [extractor.extract_from_bytes(content, url) for content, url in items]
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            return list(executor.map(_extract_in_worker, items))
\ No newline at end of file
@@ -3,31 +3,212 @@ Selenium Scraper - ROBUST VERSION
 Better DOM selectors + regex fallback for factory job extraction
 """
 
+import asyncio
+import hashlib
+import json
 import logging
 import re
-import time
 from datetime import datetime
-from typing import List, Dict, Optional
+from pathlib import Path
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
 
+import lxml.html
+import requests
+from lxml import etree
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from webdriver_manager.chrome import ChromeDriverManager
 
-from src.config import FACTORY_CAREER_URL
+from src.config import CACHE_DIR, FACTORY_CAREER_URL, SCRAPER_TIMEOUT
+
+try:
+    import re2  # Optional: google-re2 linear-time (DFA) regex engine
+except ImportError:
+    re2 = None
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# ChromeDriverManager().install() result, resolved once per process (the
+# install step does a version lookup and possibly a download on every call)
+_CHROMEDRIVER_PATH: Optional[str] = None
+
+# Pre-compiled patterns (compiled once at import, not per call)
+# Job title patterns used by SeleniumScraper._extract_with_regex
+_JOB_PATTERNS = [
+    r'(Production|Manufacturing|Assembly|Plant|Quality|Maintenance|Warehouse|Logistics|Tool|Die|Mold|Process|Line)\s+(Manager|Engineer|Supervisor|Operator|Technician|Coordinator|Specialist|Planner|Designer|Controller|Lead|Head|In-charge)',
+    r'(Senior|Junior|Lead|Chief|Deputy|Assistant|Sr\.|Jr\.)\s+\w+\s+(Engineer|Manager|Supervisor|Coordinator|Technician|Specialist)',
+    r'\w+\s+(Operator|Technician|Mechanic|Fitter|Welder|Assembler|Inspector|Machinist)',
+    r'(Shift|Floor|Line|Production|Process|Material)\s+(Manager|Supervisor|Coordinator|In-charge|Lead|Engineer)',
+    r'(Inventory|Supply Chain|Stamping|Welding|Painting|Injection|Molding)\s+(Engineer|Manager|Supervisor|Technician|Specialist)'
+]
+
+# All job patterns fused into one alternation: a single pass over the page text.
+# Compiled with RE2 when installed, so scanning stays linear on hostile pages.
+_UNION_JOB_SOURCE = "|".join(f"(?:{p})" for p in _JOB_PATTERNS)
+_UNION_JOB_RE = None
+if re2 is not None:
+    try:
+        _UNION_JOB_RE = re2.compile(f'(?i){_UNION_JOB_SOURCE}')
+    except Exception:
+        _UNION_JOB_RE = None
+if _UNION_JOB_RE is None:
+    _UNION_JOB_RE = re.compile(_UNION_JOB_SOURCE, re.IGNORECASE)
+
+# Job title patterns used by RegexFallbackScraper.extract_from_text
+_FALLBACK_JOB_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in [
+    r'(Production|Manufacturing|Assembly|Plant|Quality|Maintenance|Warehouse|Logistics|Tool|Die|Mold)\s+(Manager|Engineer|Supervisor|Operator|Technician)',
+    r'(Shift|Line|Floor|Material)\s+(Manager|Supervisor|Lead|Coordinator)',
+    r'(Technician|Mechanic|Fitter|Welder|Assembler|Inspector|Machinist)'
+])
+
+# Non-factory roles excluded by _is_factory_job (already lowercase)
+_NON_FACTORY_KEYWORDS = (
+    'software', 'developer', 'programmer', 'data scientist',
+    'it ', 'digital', 'cyber', 'application', 'web', 'mobile',
+    'cloud', 'devops', 'analyst', 'sap', 'erp', 'finance',
+    'hr', 'marketing', 'sales', 'legal', 'admin'
+)
+_NON_FACTORY_RE = re.compile("|".join(re.escape(kw) for kw in _NON_FACTORY_KEYWORDS))
+
+# XPath queries used by _extract_from_html: case-insensitive substring tests on
+# @class, evaluated by lxml in C instead of a Python regex per element.
+# Compiled once here; element.xpath(str) would re-parse the expression per call
+def _class_has(*words: str) -> str:
+    lower_class = "translate(@class, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+    return ' or '.join(f"contains({lower_class}, '{word}')" for word in words)
+
+
+_XPATH_JOB = etree.XPath(f"//*[self::div or self::li or self::tr][{_class_has('job', 'position', 'career', 'vacancy')}]")
+_XPATH_TITLE = etree.XPath(f"(.//*[self::h3 or self::h4 or self::a or self::span][{_class_has('title', 'name')}])[1]")
+_XPATH_LOC = etree.XPath(f"(.//*[self::span or self::div][{_class_has('location', 'city', 'place')}])[1]")
+_XPATH_TEXT = etree.XPath(".//text()[not(parent::script or parent::style)]")
+_XPATH_NOT_TEXT = etree.XPath("//script | //style | //noscript")
+# Block-level elements: _html_to_text puts their text on separate lines
+_XPATH_BLOCK = etree.XPath(" | ".join(f"//{tag}" for tag in (
+    'p', 'div', 'li', 'ul', 'ol', 'dl', 'dt', 'dd', 'tr', 'td', 'th', 'table',
+    'section', 'article', 'header', 'footer', 'nav', 'aside', 'main', 'form',
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'blockquote', 'pre', 'address'
+)))
+
+# Job card selectors tried (in order) by _extract_with_dom_strategy1
+_CARD_SELECTORS = [
+    "div.job-item",
+    "div.job-card",
+    "div.position-item",
+    "div.career-item",
+    "li.job-listing",
+    "tr.job-row",
+    "div[class*='job']",
+    "div[data-job-id]"
+]
+
+# Any of these present means the job listings have rendered. Generic tables
+# and lists are left out: static navigation has them before any JS runs
+_CONTENT_SELECTOR = ", ".join(_CARD_SELECTORS)
+
+# Upper bound on that wait (the old fixed sleep): pages listing jobs as tables,
+# lists or plain text, or with no openings, never match the card selectors
+_CONTENT_WAIT_SECONDS = 3
+
+# One execute_script call snapshots everything the three DOM strategies read,
+# instead of one WebDriver round-trip per element/field/strategy.
+# - cards: elements matching any card selector (one merged query); `hits` are
+#   the indices of the selectors each element matches. Fields take the first
+#   non-empty match of their selector list and fall back to the element text.
+# - rows: td texts of every table row except each table's header row
+# - items: text of every li inside every ul/ol
+_JS_DOM_SNAPSHOT = """
+const [cardSels, titleSels, locationSels, departmentSels, linkSels] = arguments;
+const text = el => (el.innerText || '').trim();
+const pick = (el, sels, read) => {
+    for (const sel of sels) {
+        const found = el.querySelector(sel);
+        const value = found && read(found);
+        if (value) return value;
+    }
+    return null;
+};
+const cards = Array.from(document.querySelectorAll(cardSels.join(', ')), e => ({
+    hits: cardSels.map((sel, i) => e.matches(sel) ? i : -1).filter(i => i >= 0),
+    title: pick(e, titleSels, text) || text(e),
+    location: pick(e, locationSels, text) || text(e),
+    department: pick(e, departmentSels, text) || text(e),
+    link: pick(e, linkSels, el => el.href),
+    text: e.innerText || ''
+}));
+const rows = [];
+for (const table of document.querySelectorAll('table')) {
+    for (const row of Array.from(table.querySelectorAll('tr')).slice(1)) {
+        rows.push(Array.from(row.querySelectorAll('td'), td => td.innerText || ''));
+    }
+}
+const items = [];
+for (const list of document.querySelectorAll('ul, ol')) {
+    for (const li of list.querySelectorAll('li')) items.push(li.innerText || '');
+}
+return {cards: cards, rows: rows, items: items};
+"""
+
+_TITLE_SELECTORS = ["a.job-title", "h3", "h4", ".title", "a[href*='job']"]
+_LOCATION_SELECTORS = [".location", ".job-location", "span.city", ".place"]
+_DEPARTMENT_SELECTORS = [".department", ".category", ".division"]
+_LINK_SELECTORS = ["a.job-title", "a.job-link", "a[href*='job']"]
+
+# Longest text accepted as a job title on the HTTP fast path
+_MAX_TITLE_LENGTH = 80
+
+# Title/location separator used by _extract_with_dom_strategy3
+_SPLIT_RE = re.compile(r'[-|–—]')
+
+
+# Both checks are pure in their arguments and see the same titles and snippets
+# over and over on one page, so they are memoized. Module-level functions
+# taking the scraper's compiled inputs explicitly: a cache on the instance
+# would tie each scraper into a reference cycle
+@lru_cache(maxsize=4096)
+def _is_factory_title(title: str, factory_re: re.Pattern) -> bool:
+    if not title or len(title) < 5:
+        return False
+    
+    title_lower = title.lower()
+    
+    # Exclude non-factory roles
+    if _NON_FACTORY_RE.search(title_lower):
+        return False
+    
+    # Check for factory keywords
+    return bool(factory_re.search(title_lower))
+
+
+@lru_cache(maxsize=4096)
+def _find_city(text: str, cities_lower: Tuple[Tuple[str, str], ...]) -> str:
+    """First of the (city, lowercased city) pairs found in text, else 'India'"""
+    if not text:
+        return 'India'
+    
+    text_lower = text.lower()
+    
+    # Check for city names
+    for city, city_lower in cities_lower:
+        if city_lower in text_lower:
+            return city
+    
+    return 'India'
+
 
 class SeleniumScraper:
     """Production-grade Selenium scraper with multiple strategies"""
     
     def __init__(self, headless: bool = True):
         self.headless = headless
+        self._driver = None  # Started lazily, reused across scrape_jobs calls
         self.factory_keywords = [
             'plant', 'production', 'manufacturing', 'assembly', 'operator',
             'technician', 'mechanic', 'maintenance', 'quality', 'supervisor',
@@ -43,6 +224,13 @@ class SeleniumScraper:
             'Gurgaon', 'Gurugram', 'Noida', 'Haridwar', 'Bawal', 'Dharuhera',
             'Greater Noida', 'Aurangabad', 'Coimbatore', 'India'
         ]
+        
+        # Lowercased once here instead of on every lookup; the keyword test is
+        # one regex search instead of a substring scan per keyword
+        self._factory_re = re.compile("|".join(re.escape(kw.lower()) for kw in self.factory_keywords))
+        # Whole words only ('line' not in 'online', 'die' not in 'studies')
+        self._factory_word_re = re.compile(r"\b(?:" + "|".join(re.escape(kw.lower()) for kw in self.factory_keywords) + r")\b")
+        self._cities_lower = tuple((city, city.lower()) for city in self.indian_cities)
     
     def _init_driver(self):
         """Initialize ChromeDriver with robust settings"""
@@ -56,9 +244,21 @@ class SeleniumScraper:
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
         chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
         
+        # Only text is extracted: don't wait for or download images, CSS and fonts
+        chrome_options.page_load_strategy = 'eager'
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2,
+            "profile.managed_default_content_settings.fonts": 2
+        })
+        
         try:
             # FIXED: Remove os_type parameter
-            service = Service(ChromeDriverManager().install())
+            global _CHROMEDRIVER_PATH
+            if _CHROMEDRIVER_PATH is None:
+                _CHROMEDRIVER_PATH = ChromeDriverManager().install()
+            service = Service(_CHROMEDRIVER_PATH)
             driver = webdriver.Chrome(service=service, options=chrome_options)
             return driver
         except Exception as e:
@@ -67,96 +267,215 @@ class SeleniumScraper:
             driver = webdriver.Chrome(options=chrome_options)
             return driver
     
-    def scrape_jobs(self, url: str = FACTORY_CAREER_URL) -> List[Dict]:
+    def _get_driver(self):
+        """Return the warm browser, starting it on first use"""
+        if self._driver is None:
+            self._driver = self._init_driver()
+        return self._driver
+    
+    def close(self):
+        """Quit the browser (a later scrape_jobs call starts a new one)"""
+        if self._driver is not None:
+            try:
+                self._driver.quit()
+            except Exception as e:
+                logger.warning(f"ChromeDriver quit failed: {e}")
+            self._driver = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def _get_cache_path(self, url: str) -> Path:
+        url_hash = hashlib.md5(url.encode()).hexdigest()
+        return CACHE_DIR / f"jobs_{url_hash}.json"
+    
+    def _load_from_cache(self, url: str) -> Optional[Dict]:
+        cache_path = self._get_cache_path(url)
+        if cache_path.exists():
+            try:
+                return json.loads(cache_path.read_text(encoding='utf-8'))
+            except Exception:
+                pass
+        return None
+    
+    def _save_to_cache(self, url: str, validators: Dict, jobs: List[Dict]):
+        """Store jobs parsed from a page's HTML with that page's ETag/Last-Modified"""
+        if not validators or not jobs:
+            return
+        try:
+            self._get_cache_path(url).write_text(
+                json.dumps({**validators, 'jobs': jobs}, indent=2, ensure_ascii=False),
+                encoding='utf-8'
+            )
+        except Exception as e:
+            logger.warning(f"Cache write error: {e}")
+    
+    def _try_http_fetch(self, url: str, cached: Optional[Dict] = None) -> Tuple[List[Dict], Dict]:
+        """Fetch the page over plain HTTP and parse the static HTML (no browser)
+        
+        Returns (jobs, validators). With a cached entry the request is conditional,
+        and a 304 returns the cached jobs without parsing anything.
+        """
+        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+        
+        try:
+            resp = requests.get(url, headers=headers, timeout=SCRAPER_TIMEOUT)
+            if resp.status_code == 304 and cached:
+                logger.info("📦 Career page not modified, using cached jobs")
+                return cached['jobs'], {k: cached.get(k) for k in ('etag', 'last_modified')}
+            resp.raise_for_status()
+        except Exception as e:
+            logger.warning(f"HTTP fetch failed, falling back to browser: {e}")
+            return [], {}
+        
+        validators = {}
+        if resp.headers.get('ETag'):
+            validators['etag'] = resp.headers['ETag']
+        if resp.headers.get('Last-Modified'):
+            validators['last_modified'] = resp.headers['Last-Modified']
+        
+        # Bytes, so lxml honours the page's own encoding declaration. Strict:
+        # jobs found here skip the browser and are cached
+        return self._extract_from_html(resp.content, strict=True), validators
+    
+    def scrape_jobs(self, url: str = FACTORY_CAREER_URL, use_cache: bool = True) -> List[Dict]:
         """Scrape jobs with multiple extraction strategies"""
         logger.info(f"🔍 Scraping jobs from: {url}")
-        driver = self._init_driver()
+        
+        # Fast path: static HTML is enough for most career pages, and an
+        # unchanged page (304) skips parsing and the browser entirely
+        cached = self._load_from_cache(url) if use_cache else None
+        jobs, validators = self._try_http_fetch(url, cached)
+        if jobs:
+            logger.info(f"✅ Extracted {len(jobs)} jobs via HTTP")
+            self._save_to_cache(url, validators, jobs)
+            return jobs
+        
+        driver = self._get_driver()
         
         try:
             driver.get(url)
-            time.sleep(3)  # Wait for JavaScript to load
+            WebDriverWait(driver, SCRAPER_TIMEOUT).until(
+                EC.presence_of_element_located((By.TAG_NAME, "body"))
+            )
+            # Wait for JavaScript-rendered job cards, at most as long as the old fixed sleep
+            try:
+                WebDriverWait(driver, _CONTENT_WAIT_SECONDS).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, _CONTENT_SELECTOR))
+                )
+            except TimeoutException:
+                logger.warning("⚠️ No job content rendered, extracting what is there")
             
             # Try multiple extraction strategies
             jobs = []
             
             # Strategy 1: Try structured DOM extraction (multiple selectors)
-            jobs = self._extract_with_dom_strategy1(driver)
+            snapshot = self._snapshot_dom(driver)
+            jobs = self._extract_with_dom_strategy1(snapshot)
             if not jobs:
-                jobs = self._extract_with_dom_strategy2(driver)
+                jobs = self._extract_with_dom_strategy2(snapshot)
             if not jobs:
-                jobs = self._extract_with_dom_strategy3(driver)
+                jobs = self._extract_with_dom_strategy3(snapshot)
             
             # Strategy 2: Fallback to regex extraction
             if not jobs:
                 logger.warning("⚠️ DOM extraction failed, using regex fallback")
-                page_text = driver.find_element(By.TAG_NAME, "body").text
+                # One page_source call, shared with strategy 3
+                html_source = driver.page_source
+                page_text = self._html_to_text(html_source)
                 jobs = self._extract_with_regex(page_text)
             
             # Strategy 3: Last resort - parse HTML source
             if not jobs:
                 logger.warning("⚠️ Regex failed, parsing HTML source")
-                html_source = driver.page_source
                 jobs = self._extract_from_html(html_source)
             
             logger.info(f"✅ Extracted {len(jobs)} jobs")
+            # Not cached: the static shell's validators say nothing about the
+            # JS-loaded job feed, so a 304 would keep serving stale jobs
             return jobs
         
         except Exception as e:
             logger.error(f"❌ Job scraping failed: {e}")
             import traceback
             traceback.print_exc()
+            # The session may be unusable now; start a fresh browser next time
+            self.close()
             return []
+    
+    async def scrape_jobs_many(self, urls: List[str], concurrency: int = 8) -> List[List[Dict]]:
+        """Scrape several career pages concurrently (results in the order of urls)"""
+        if not urls:
+            return []
+        
+        # Pool of scrapers, one browser each (drivers are not thread-safe).
+        # Browsers start lazily, so pages served by the HTTP fast path never launch one.
+        extra = [SeleniumScraper(headless=self.headless) for _ in range(min(concurrency, len(urls)) - 1)]
+        pool = asyncio.Queue()
+        for scraper in [self] + extra:
+            pool.put_nowait(scraper)
+        
+        async def scrape_one(url: str) -> List[Dict]:
+            scraper = await pool.get()
+            try:
+                return await asyncio.to_thread(scraper.scrape_jobs, url)
+            finally:
+                pool.put_nowait(scraper)
         
+        try:
+            return list(await asyncio.gather(*(scrape_one(url) for url in urls)))
         finally:
-            driver.quit()
+            for scraper in extra:
+                scraper.close()
+    
+    def _snapshot_dom(self, driver) -> Dict:
+        """Read all DOM data the strategies need in a single round-trip"""
+        try:
+            return driver.execute_script(
+                _JS_DOM_SNAPSHOT, _CARD_SELECTORS, _TITLE_SELECTORS,
+                _LOCATION_SELECTORS, _DEPARTMENT_SELECTORS, _LINK_SELECTORS
+            ) or {}
+        except Exception as e:
+            logger.warning(f"DOM snapshot failed: {e}")
+            return {}
     
-    def _extract_with_dom_strategy1(self, driver) -> List[Dict]:
+    def _extract_with_dom_strategy1(self, snapshot: Dict) -> List[Dict]:
         """Strategy 1: Common job board selectors"""
         try:
-            wait = WebDriverWait(driver, 10)
+            # Group the merged query's elements back by selector (document order)
+            by_selector = [[] for _ in _CARD_SELECTORS]
+            for card in snapshot.get('cards', []):
+                for i in card['hits']:
+                    by_selector[i].append(card)
             
             # Try common selectors
-            selectors = [
-                "div.job-item",
-                "div.job-card",
-                "div.position-item",
-                "div.career-item",
-                "li.job-listing",
-                "tr.job-row",
-                "div[class*='job']",
-                "div[data-job-id]"
-            ]
-            
             jobs = []
-            for selector in selectors:
-                try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        logger.info(f"✅ Found {len(elements)} jobs with selector: {selector}")
-                        
-                        for elem in elements:
-                            try:
-                                # Extract job data
-                                title = self._extract_text(elem, ["a.job-title", "h3", "h4", ".title", "a[href*='job']"])
-                                location = self._extract_text(elem, [".location", ".job-location", "span.city", ".place"])
-                                department = self._extract_text(elem, [".department", ".category", ".division"])
-                                link = self._extract_link(elem, ["a.job-title", "a.job-link", "a[href*='job']"])
-                                
-                                if title and self._is_factory_job(title):
-                                    jobs.append({
-                                        'title': title.strip(),
-                                        'location': location or self._guess_location(elem.text),
-                                        'department': department,
-                                        'url': link or FACTORY_CAREER_URL,
-                                        'source': 'motherson_careers'
-                                    })
-                            except:
-                                continue
+            for selector, elements in zip(_CARD_SELECTORS, by_selector):
+                if elements:
+                    logger.info(f"✅ Found {len(elements)} jobs with selector: {selector}")
+                    
+                    for elem in elements:
+                        title = elem['title']
                         
-                        if jobs:
-                            return jobs
-                except:
-                    continue
+                        if title and self._is_factory_job(title):
+                            jobs.append({
+                                'title': title.strip(),
+                                'location': elem['location'] or self._guess_location(elem['text']),
+                                'department': elem['department'],
+                                'url': elem['link'] or FACTORY_CAREER_URL,
+                                'source': 'motherson_careers'
+                            })
+                    
+                    if jobs:
+                        return jobs
             
             return jobs
         
@@ -164,30 +483,23 @@ class SeleniumScraper:
             logger.warning(f"Strategy 1 failed: {e}")
             return []
     
-    def _extract_with_dom_strategy2(self, driver) -> List[Dict]:
+    def _extract_with_dom_strategy2(self, snapshot: Dict) -> List[Dict]:
         """Strategy 2: Table-based extraction"""
         try:
-            tables = driver.find_elements(By.TAG_NAME, "table")
-            
             jobs = []
-            for table in tables:
-                rows = table.find_elements(By.TAG_NAME, "tr")
-                
-                for row in rows[1:]:  # Skip header
-                    cells = row.find_elements(By.TAG_NAME, "td")
+            for cells in snapshot.get('rows', []):
+                if len(cells) >= 2:
+                    title = cells[0].strip()
+                    location = cells[1].strip() if len(cells) > 1 else 'India'
                     
-                    if len(cells) >= 2:
-                        title = cells[0].text.strip()
-                        location = cells[1].text.strip() if len(cells) > 1 else 'India'
-                        
-                        if title and self._is_factory_job(title):
-                            jobs.append({
-                                'title': title,
-                                'location': location,
-                                'department': None,
-                                'url': FACTORY_CAREER_URL,
-                                'source': 'motherson_careers_table'
-                            })
+                    if title and self._is_factory_job(title):
+                        jobs.append({
+                            'title': title,
+                            'location': location,
+                            'department': None,
+                            'url': FACTORY_CAREER_URL,
+                            'source': 'motherson_careers_table'
+                        })
             
             if jobs:
                 logger.info(f"✅ Strategy 2 found {len(jobs)} jobs")
@@ -197,33 +509,28 @@ class SeleniumScraper:
             logger.warning(f"Strategy 2 failed: {e}")
             return []
     
-    def _extract_with_dom_strategy3(self, driver) -> List[Dict]:
+    def _extract_with_dom_strategy3(self, snapshot: Dict) -> List[Dict]:
         """Strategy 3: List-based extraction"""
         try:
-            lists = driver.find_elements(By.CSS_SELECTOR, "ul, ol")
-            
             jobs = []
-            for list_elem in lists:
-                items = list_elem.find_elements(By.TAG_NAME, "li")
+            for item_text in snapshot.get('items', []):
+                text = item_text.strip()
                 
-                for item in items:
-                    text = item.text.strip()
+                # Check if it looks like a job posting
+                if len(text) > 10 and len(text) < 200:
+                    # Try to split title and location
+                    parts = _SPLIT_RE.split(text, maxsplit=1)
+                    title = parts[0].strip()
+                    location = parts[1].strip() if len(parts) > 1 else 'India'
                     
-                    # Check if it looks like a job posting
-                    if len(text) > 10 and len(text) < 200:
-                        # Try to split title and location
-                        parts = re.split(r'[-|–—]', text, maxsplit=1)
-                        title = parts[0].strip()
-                        location = parts[1].strip() if len(parts) > 1 else 'India'
-                        
-                        if self._is_factory_job(title):
-                            jobs.append({
-                                'title': title,
-                                'location': location or self._guess_location(text),
-                                'department': None,
-                                'url': FACTORY_CAREER_URL,
-                                'source': 'motherson_careers_list'
-                            })
+                    if self._is_factory_job(title):
+                        jobs.append({
+                            'title': title,
+                            'location': location or self._guess_location(text),
+                            'department': None,
+                            'url': FACTORY_CAREER_URL,
+                            'source': 'motherson_careers_list'
+                        })
             
             if jobs:
                 logger.info(f"✅ Strategy 3 found {len(jobs)} jobs")
@@ -236,71 +543,105 @@ class SeleniumScraper:
     def _extract_with_regex(self, text: str) -> List[Dict]:
         """Regex-based extraction as fallback"""
         jobs = []
+        seen_titles = set()
+        # Lowercased once; location lookups then search bounded spans of it in
+        # place. Only valid while lowercasing keeps offsets (true for the usual text)
+        text_lower = text.lower()
+        if len(text_lower) != len(text):
+            text_lower = None
         
-        # Enhanced job patterns
-        patterns = [
-            r'(Production|Manufacturing|Assembly|Plant|Quality|Maintenance|Warehouse|Logistics|Tool|Die|Mold|Process|Line)\s+(Manager|Engineer|Supervisor|Operator|Technician|Coordinator|Specialist|Planner|Designer|Controller|Lead|Head|In-charge)',
-            r'(Senior|Junior|Lead|Chief|Deputy|Assistant|Sr\.|Jr\.)\s+\w+\s+(Engineer|Manager|Supervisor|Coordinator|Technician|Specialist)',
-            r'\w+\s+(Operator|Technician|Mechanic|Fitter|Welder|Assembler|Inspector|Machinist)',
-            r'(Shift|Floor|Line|Production|Process|Material)\s+(Manager|Supervisor|Coordinator|In-charge|Lead|Engineer)',
-            r'(Inventory|Supply Chain|Stamping|Welding|Painting|Injection|Molding)\s+(Engineer|Manager|Supervisor|Technician|Specialist)'
-        ]
-        
-        for pattern in patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                title = match.group(0).strip()
+        for match in _UNION_JOB_RE.finditer(text):
+            # A match may span a line break; store the title on one line
+            title = ' '.join(match.group(0).split())
+            
+            # Deduplicate as we go (first occurrence of a title wins). A repeated
+            # title gets the same _is_factory_job verdict, so skip it up front
+            title_lower = title.lower()
+            if title_lower in seen_titles:
+                continue
+            seen_titles.add(title_lower)
+            
+            if self._is_factory_job(title):
+                # Try to find location nearby
+                context_start = max(0, match.start() - 200)
+                context_end = min(len(text), match.end() + 200)
+                if text_lower is not None:
+                    location = self._guess_location_in_span(text_lower, context_start, context_end)
+                else:
+                    location = self._guess_location(text[context_start:context_end])
                 
-                if self._is_factory_job(title):
-                    # Try to find location nearby
-                    context_start = max(0, match.start() - 200)
-                    context_end = min(len(text), match.end() + 200)
-                    context = text[context_start:context_end]
-                    
-                    location = self._guess_location(context)
-                    
-                    jobs.append({
-                        'title': title,
-                        'location': location,
-                        'department': None,
-                        'url': FACTORY_CAREER_URL,
-                        'source': 'regex_extraction'
-                    })
+                jobs.append({
+                    'title': title,
+                    'location': location,
+                    'department': None,
+                    'url': FACTORY_CAREER_URL,
+                    'source': 'regex_extraction'
+                })
         
-        # Deduplicate
-        unique_jobs = []
-        seen_titles = set()
-        for job in jobs:
-            title_lower = job['title'].lower()
-            if title_lower not in seen_titles:
-                seen_titles.add(title_lower)
-                unique_jobs.append(job)
+        if jobs:
+            logger.info(f"✅ Regex extraction found {len(jobs)} jobs")
+        return jobs
+    
+    def _parse_html(self, html) -> Optional[lxml.html.HtmlElement]:
+        """lxml document for raw HTML (str or bytes), None if it cannot be parsed"""
+        try:
+            return lxml.html.document_fromstring(html)
+        except (etree.ParserError, ValueError) as e:
+            # Empty body, or a str carrying an XML encoding declaration
+            logger.warning(f"HTML parsing failed: {e}")
+            return None
+    
+    def _html_to_text(self, html) -> str:
+        """Page text from raw HTML (cheaper than Selenium's layout-based body.text)"""
+        doc = self._parse_html(html)
+        if doc is None:
+            return ''
+        for elem in _XPATH_NOT_TEXT(doc):
+            elem.drop_tree()
+        
+        # Line breaks around block elements and at <br>, like body.text; inline
+        # tags (<b>, <span>, ...) stay part of the surrounding line
+        for elem in _XPATH_BLOCK(doc):
+            elem.text = '\n' + (elem.text or '')
+            elem.tail = '\n' + (elem.tail or '')
+        for elem in doc.iter('br'):
+            elem.tail = '\n' + (elem.tail or '')
         
-        if unique_jobs:
-            logger.info(f"✅ Regex extraction found {len(unique_jobs)} jobs")
-        return unique_jobs
+        body = doc.find('body')
+        return (body if body is not None else doc).text_content()
     
-    def _extract_from_html(self, html: str) -> List[Dict]:
-        """Parse HTML source as last resort"""
-        from bs4 import BeautifulSoup
+    def _extract_from_html(self, html, strict: bool = False) -> List[Dict]:
+        """Parse HTML source as last resort
+        
+        strict (HTTP fast path): only cards with a title element, whose title
+        passes _is_job_title, so wrapper elements never become jobs
+        """
+        def get_text(elem) -> str:
+            return ''.join(s.strip() for s in _XPATH_TEXT(elem))
+        
+        doc = self._parse_html(html)
+        if doc is None:
+            return []
         
         jobs = []
-        soup = BeautifulSoup(html, 'html.parser')
         
         # Look for job-related elements
-        job_elements = soup.find_all(['div', 'li', 'tr'], class_=re.compile(r'job|position|career|vacancy', re.I))
+        job_elements = _XPATH_JOB(doc)
         
         for elem in job_elements:
-            text = elem.get_text(strip=True)
+            text = get_text(elem)
             
-            # Extract title
-            title_elem = elem.find(['h3', 'h4', 'a', 'span'], class_=re.compile(r'title|name', re.I))
-            title = title_elem.get_text(strip=True) if title_elem else text[:100]
+            # Extract title (first match only)
+            title_elems = _XPATH_TITLE(elem)
+            if strict and not title_elems:
+                continue
+            title = get_text(title_elems[0]) if title_elems else text[:100]
             
             # Extract location
-            loc_elem = elem.find(['span', 'div'], class_=re.compile(r'location|city|place', re.I))
-            location = loc_elem.get_text(strip=True) if loc_elem else self._guess_location(text)
+            loc_elems = _XPATH_LOC(elem)
+            location = get_text(loc_elems[0]) if loc_elems else self._guess_location(text)
             
-            if title and self._is_factory_job(title):
+            if title and (self._is_job_title(title) if strict else self._is_factory_job(title)):
                 jobs.append({
                     'title': title,
                     'location': location,
@@ -313,66 +654,24 @@ class SeleniumScraper:
             logger.info(f"✅ HTML parsing found {len(jobs)} jobs")
         return jobs
     
-    def _extract_text(self, element, selectors: List[str]) -> Optional[str]:
-        """Try multiple selectors to extract text"""
-        for selector in selectors:
-            try:
-                elem = element.find_element(By.CSS_SELECTOR, selector)
-                text = elem.text.strip()
-                if text:
-                    return text
-            except:
-                continue
-        
-        # Fallback: return element text
-        try:
-            return element.text.strip()
-        except:
-            return None
-    
-    def _extract_link(self, element, selectors: List[str]) -> Optional[str]:
-        """Try multiple selectors to extract link"""
-        for selector in selectors:
-            try:
-                elem = element.find_element(By.CSS_SELECTOR, selector)
-                href = elem.get_attribute('href')
-                if href:
-                    return href
-            except:
-                continue
-        return None
-    
     def _is_factory_job(self, title: str) -> bool:
         """Check if job title is factory-related"""
-        if not title or len(title) < 5:
-            return False
-        
-        title_lower = title.lower()
-        
-        # Exclude non-factory roles
-        non_factory_keywords = [
-            'software', 'developer', 'programmer', 'data scientist',
-            'it ', 'digital', 'cyber', 'application', 'web', 'mobile',
-            'cloud', 'devops', 'analyst', 'sap', 'erp', 'finance',
-            'hr', 'marketing', 'sales', 'legal', 'admin'
-        ]
-        
-        if any(kw in title_lower for kw in non_factory_keywords):
-            return False
-        
-        # Check for factory keywords
-        return any(kw in title_lower for kw in self.factory_keywords)
+        return _is_factory_title(title, self._factory_re)
+    
+    def _is_job_title(self, title: str) -> bool:
+        """Stricter _is_factory_job: a short title with a whole-word factory keyword"""
+        return (len(title) <= _MAX_TITLE_LENGTH
+                and self._is_factory_job(title)
+                and bool(self._factory_word_re.search(title.lower())))
     
     def _guess_location(self, text: str) -> str:
         """Guess location from text"""
-        if not text:
-            return 'India'
-        
-        text_lower = text.lower()
-        
-        # Check for city names
-        for city in self.indian_cities:
-            if city.lower() in text_lower:
+        return _find_city(text, self._cities_lower)
+    
+    def _guess_location_in_span(self, text_lower: str, start: int, end: int) -> str:
+        """Same as _guess_location(text[start:end]), searching the lowercased page in place"""
+        for city, city_lower in self._cities_lower:
+            if text_lower.find(city_lower, start, end) != -1:
                 return city
         
         return 'India'
@@ -397,22 +696,20 @@ class RegexFallbackScraper:
             'Gurgaon', 'Gurugram', 'Noida', 'Haridwar', 'Bawal', 'Dharuhera',
             'Greater Noida', 'Aurangabad', 'Coimbatore'
         ]
+        self._cities_lower = [(city, city.lower()) for city in self.indian_cities]
     
     def extract_from_text(self, text: str) -> List[Dict]:
         """Use regex to identify likely factory job listings"""
         jobs = []
-        job_patterns = [
-            r'(Production|Manufacturing|Assembly|Plant|Quality|Maintenance|Warehouse|Logistics|Tool|Die|Mold)\s+(Manager|Engineer|Supervisor|Operator|Technician)',
-            r'(Shift|Line|Floor|Material)\s+(Manager|Supervisor|Lead|Coordinator)',
-            r'(Technician|Mechanic|Fitter|Welder|Assembler|Inspector|Machinist)'
-        ]
-        
-        for pattern in job_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        location = None  # Same text for every match: guess it once
+        for pattern in _FALLBACK_JOB_PATTERNS:
+            matches = pattern.finditer(text)
             for m in matches:
                 title = m.group(0).strip()
                 if self._is_valid_job(title):
-                    jobs.append({"title": title, "location": self._guess_location(text)})
+                    if location is None:
+                        location = self._guess_location(text)
+                    jobs.append({"title": title, "location": location})
         
         # Deduplicate
         unique = []
@@ -431,7 +728,8 @@ class RegexFallbackScraper:
         return any(kw in title_lower for kw in self.factory_keywords)
     
     def _guess_location(self, text: str) -> str:
-        for city in self.indian_cities:
-            if city.lower() in text.lower():
+        text_lower = text.lower()
+        for city, city_lower in self._cities_lower:
+            if city_lower in text_lower:
                 return city
         return "India"
\ No newline at end of file
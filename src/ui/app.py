@@ -4,19 +4,26 @@ No errors, all imports included
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
+import hashlib
 import logging
+import os
+import pickle
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import datetime, timedelta
-from typing import List, Dict
+from typing import List, Dict, Optional
 import sys
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.rag.retriever import Retriever
-from src.rag.query_classifier import QueryClassifier
-from src.rag.generator import Generator
+from src.config import CACHE_DIR, DATA_VERSION_PATH, DB_PATH
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -29,8 +36,10 @@ st.set_page_config(
     layout="wide"
 )
 
-# Custom CSS
-st.markdown("""
+# Custom CSS: built once per server process; every rerun re-sends the same string
+@st.cache_resource
+def _css() -> str:
+    return """
 <style>
 .main-header {
     font-size: 2.5rem;
@@ -50,22 +59,6 @@ st.markdown("""
     margin-bottom: 1rem;
     border-radius: 0.5rem;
 }
-.highlight {
-    background-color: #fef3c7;
-    padding: 0.125rem 0.25rem;
-    border-radius: 0.25rem;
-    font-weight: 600;
-}
-.citation {
-    background-color: #3b82f6;
-    color: white;
-    padding: 0.125rem 0.375rem;
-    border-radius: 0.25rem;
-    font-size: 0.75rem;
-    font-weight: bold;
-    text-decoration: none;
-    vertical-align: super;
-}
 .confidence-high {
     background-color: #d1fae5;
     color: #065f46;
@@ -91,11 +84,18 @@ st.markdown("""
     font-weight: 600;
 }
 </style>
-""", unsafe_allow_html=True)
+"""
 
-# Initialize components
+st.markdown(_css(), unsafe_allow_html=True)
+
+# Initialize components (the RAG modules and their heavy dependencies are
+# imported here, once per server process)
 @st.cache_resource
 def init_components():
+    from src.rag.retriever import Retriever
+    from src.rag.query_classifier import QueryClassifier
+    from src.rag.generator import Generator
+    
     retriever = Retriever()
     classifier = QueryClassifier()
     generator = Generator()
@@ -103,6 +103,78 @@ def init_components():
 
 retriever, classifier, generator = init_components()
 
+# Thread pools for I/O-bound retrieval calls (one per server process, not one
+# per script rerun): fast calls (vector store) and slow ones (graph queries)
+@st.cache_resource
+def init_io_pool():
+    return ThreadPoolExecutor(max_workers=4)
+
+@st.cache_resource
+def init_slow_pool():
+    return ThreadPoolExecutor(max_workers=2)
+
+_IO_POOL = init_io_pool()
+_SLOW_POOL = init_slow_pool()
+
+# Finished query results (processed data, evidence, answer), keyed by
+# (query_text, query_type, filters). Shared by all sessions, like st.cache_data:
+# entries are only read and replaced under the lock, and callers get copies
+QUERY_CACHE_TTL = 300
+QUERY_CACHE_MAX_ENTRIES = 64
+
+@st.cache_resource
+def init_query_cache():
+    return OrderedDict()
+
+@st.cache_resource
+def init_query_cache_lock():
+    return threading.Lock()
+
+_QUERY_CACHE = init_query_cache()
+_QUERY_CACHE_LOCK = init_query_cache_lock()
+
+# How long a query blocks the page on graph retrieval before it is finished
+# in the background (polled on later reruns)
+GRAPH_WAIT_SECONDS = 0.25
+GRAPH_POLL_SECONDS = 0.25
+
+# Heuristic bypass for simple free-text queries (no explicit query type): the
+# first pattern matching the start of the query picks the type without the
+# classifier, and a bare facility listing skips the vector search and LLM
+# summary (the results table is the answer). Anything else is classified
+_QUICK_PATTERNS = (
+    (re.compile(r'^\s*(?:list|show)\s+(?:all\s+)?(?:the\s+)?facilities\s*[.?!]?\s*$', re.IGNORECASE),
+     'list_facilities'),
+    (re.compile(r'^\s*(?:(?:list|show)\s+(?:all\s+)?(?:the\s+)?)?(?:new\s+)?(?:expansions?|greenfield)\b',
+                re.IGNORECASE), 'new_expansions'),
+    (re.compile(r'^\s*(?:(?:list|show)\s+(?:all\s+)?(?:the\s+)?)?(?:hiring|jobs?|open\s+positions)\b',
+                re.IGNORECASE), 'hiring_positions'),
+)
+_SKIP_LLM = {'list_facilities'}
+
+# Sidebar filter options (built once, not on every rerun)
+_DIVISION_OPTIONS = ("All",) + tuple(sorted(
+    ["Wiring Systems", "Vision Systems", "Seating Systems", "Polymers", "Logistics"]))
+_STATE_OPTIONS = ("All",) + tuple(sorted(
+    ["Gujarat", "Tamil Nadu", "Maharashtra", "Haryana", "Karnataka",
+     "Uttar Pradesh", "Rajasthan", "Punjab", "Telangana", "Andhra Pradesh",
+     "West Bengal", "Madhya Pradesh", "Kerala", "Odisha", "Uttarakhand"]))
+_STATUS_OPTIONS = ("All", "operational", "under-construction", "planned")
+_DEFAULT_DATE_RANGE_DAYS = 730
+
+# Fragments scope a widget's rerun to the block that owns it (st.fragment in
+# Streamlit >= 1.37, st.experimental_fragment in 1.33-1.36). On older versions
+# the blocks are plain functions and every interaction reruns the whole page.
+_FRAGMENT = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+
+def fragment(func):
+    return _FRAGMENT(func) if _FRAGMENT else func
+
+def refresh_page():
+    """Rerun the full page after a query started inside a fragment."""
+    if _FRAGMENT:
+        st.rerun()
+
 # Session state
 if 'current_results' not in st.session_state:
     st.session_state.current_results = None
@@ -114,10 +186,13 @@ if 'current_answer' not in st.session_state:
     st.session_state.current_answer = None
 if 'current_warning' not in st.session_state:
     st.session_state.current_warning = None
+if 'pending_graph' not in st.session_state:
+    st.session_state.pending_graph = None
+if 'pending_answer' not in st.session_state:
+    st.session_state.pending_answer = None
 
 # Helper functions
-def get_confidence_badge(confidence: float) -> str:
-    """Return HTML badge for confidence score"""
+def _make_badge(confidence: float) -> str:
     if confidence >= 0.8:
         return f'<span class="confidence-high">{confidence:.2f}</span>'
     elif confidence >= 0.5:
@@ -125,18 +200,90 @@ def get_confidence_badge(confidence: float) -> str:
     else:
         return f'<span class="confidence-low">{confidence:.2f}</span>'
 
-def format_location(city: str, state: str) -> str:
-    """Format location string"""
-    city = city or ''
-    state = state or ''
+# Badges for every displayable score 0.00..1.00, keyed by round(confidence * 100)
+_BADGE_CACHE = {i: _make_badge(i / 100) for i in range(101)}
+
+def get_confidence_badge(confidence: float) -> str:
+    """Return HTML badge for confidence score"""
+    badge = _BADGE_CACHE.get(round(confidence * 100))
+    return badge if badge is not None else _make_badge(confidence)
+
+# Vectorized column builders for the results tables (whole columns at once
+# instead of result.get(...) per row and cell)
+def _column(df: pd.DataFrame, name: str) -> pd.Series:
+    """Result field as a column (all missing if no result has it)"""
+    if name in df.columns:
+        return df[name].astype(object)
+    return pd.Series(None, index=df.index, dtype=object)
+
+def _is_blank(col: pd.Series) -> pd.Series:
+    return col.isna() | (col == '')
+
+def _pick(df: pd.DataFrame, *names: str, default='N/A') -> pd.Series:
+    """Column-wise `r.get(a) or r.get(b) or ... or default`"""
+    out = _column(df, names[0])
+    for name in names[1:]:
+        out = out.where(~_is_blank(out), _column(df, name))
+    return out.where(~_is_blank(out), default)
+
+def _location_column(df: pd.DataFrame) -> pd.Series:
+    """Column-wise "city, state" (either alone if the other is missing, else N/A)"""
+    city = _column(df, 'city').fillna('').astype(str)
+    state = _column(df, 'state').fillna('').astype(str)
+    location = city + np.where((city != '') & (state != ''), ', ', '') + state
+    return location.where(location != '', 'N/A')
+
+def _confidence_column(df: pd.DataFrame, default: float) -> pd.Series:
+    """Numeric confidence scores (default where missing)"""
+    return pd.to_numeric(_column(df, 'confidence'), errors='coerce').fillna(default)
+
+def _citation_column(df: pd.DataFrame) -> pd.Series:
+    """Citation numbers matching the evidence entries ([1], [2], ...)"""
+    idx = pd.Series(np.arange(1, len(df) + 1), index=df.index)
+    return '[' + idx.astype(str) + ']'
+
+# st.dataframe display settings shared by all results tables (Arrow-serialized,
+# virtualized rows instead of one large HTML string)
+RESULT_COLUMN_CONFIG = {
+    'Confidence': st.column_config.ProgressColumn('Confidence', min_value=0, max_value=1, format='%.2f'),
+    'Factory Role': st.column_config.CheckboxColumn('Factory Role'),
+    'Citation': st.column_config.TextColumn('Citation', help="Matching entry under Evidence & Citations")
+}
+
+EVIDENCE_COLUMN_CONFIG = {
+    'Confidence': RESULT_COLUMN_CONFIG['Confidence'],
+    'URL': st.column_config.LinkColumn('URL')
+}
+
+def _value_counts(df: pd.DataFrame, name: str) -> pd.Series:
+    """Counts of each non-blank value of a field, most common first (Counter.most_common)"""
+    col = _column(df, name)
+    return col[~_is_blank(col)].value_counts()
+
+def _summary_metrics(df: pd.DataFrame, query_type: str) -> List[Optional[tuple]]:
+    """(label, value) for each of the four summary metric columns, None for an empty column"""
+    metrics = [("📊 Total Results", len(df))]
+    
+    if query_type == "list_facilities":
+        metrics.append(("🏢 Divisions", len(_value_counts(df, 'division'))))
+    elif query_type == "new_expansions":
+        metrics.append(("🌱 Greenfield", int((_column(df, 'expansion_type') == 'greenfield').sum())))
+    elif query_type == "hiring_positions":
+        metrics.append(("🏭 Factory Roles", int(_column(df, 'is_factory_role').fillna(False).astype(bool).sum())))
+    else:
+        metrics.append(None)
+    
+    if query_type in ("list_facilities", "new_expansions"):
+        metrics.append(("✅ Operational", int((_column(df, 'status') == 'operational').sum())))
+    else:
+        metrics.append(("📍 Locations", len(_value_counts(df, 'location'))))
     
-    if city and state:
-        return f"{city}, {state}"
-    elif city:
-        return city
-    elif state:
-        return state
-    return "N/A"
+    metrics.append(("🎯 Avg Confidence", f"{_confidence_column(df, 0).mean():.2f}"))
+    return metrics
+
+def _normalized_key(col: pd.Series) -> pd.Series:
+    """Column-wise (value or '').strip().lower()"""
+    return col.where(~_is_blank(col), '').astype(str).str.strip().str.lower()
 
 def deduplicate_results(results: List[Dict]) -> List[Dict]:
     """
@@ -146,14 +293,35 @@ def deduplicate_results(results: List[Dict]) -> List[Dict]:
     if not results:
         return []
     
+    # Results of one query share a shape: build both key parts as columns and
+    # let pandas find duplicates. Mixed batches take the per-row path below
+    if all('facility' in r or 'name' in r for r in results):
+        df = pd.DataFrame(results)
+        key_cols = (_normalized_key(_pick(df, 'facility', 'name', default='')),
+                    _normalized_key(_column(df, 'city')))
+    elif all('title' in r for r in results):
+        df = pd.DataFrame(results)
+        key_cols = (_normalized_key(_column(df, 'title')),
+                    _normalized_key(_column(df, 'location')))
+    else:
+        key_cols = None
+    
+    if key_cols is not None:
+        # Only dedupe if BOTH key parts match; skip completely empty entries
+        keys = pd.DataFrame({'a': key_cols[0], 'b': key_cols[1]})
+        keep = ~keys.duplicated() & ((keys['a'] != '') | (keys['b'] != ''))
+        return [results[i] for i in np.flatnonzero(keep.to_numpy())]
+    
     seen = set()
     deduplicated = []
     
     for result in results:
+        g = result.get
+        
         # Build unique key based on query type
         if 'facility' in result or 'name' in result:
-            facility = (result.get('facility') or result.get('name') or '').strip()
-            city = (result.get('city') or '').strip()
+            facility = (g('facility') or g('name') or '').strip()
+            city = (g('city') or '').strip()
             
             # Only dedupe if BOTH facility AND city match
             key = (facility.lower(), city.lower())
@@ -163,8 +331,8 @@ def deduplicate_results(results: List[Dict]) -> List[Dict]:
                 continue
                 
         elif 'title' in result:
-            title = (result.get('title') or '').strip()
-            location = (result.get('location') or '').strip()
+            title = (g('title') or '').strip()
+            location = (g('location') or '').strip()
             
             # Only dedupe if BOTH title AND location match
             key = (title.lower(), location.lower())
@@ -182,48 +350,178 @@ def deduplicate_results(results: List[Dict]) -> List[Dict]:
     
     return deduplicated
 
-def execute_query(query_text: str = None, query_type: str = None, filters: Dict = None):
+# Memoized across reruns: the same query text / graph results come back often
+@st.cache_data(ttl=600, max_entries=256, show_spinner=False)
+def _classify(query_text: str) -> str:
+    return classifier.classify(query_text)
+
+@st.cache_data(ttl=600, max_entries=256, show_spinner=False)
+def _dedupe(results: List[Dict]) -> List[Dict]:
+    return deduplicate_results(results)
+
+def _query_cache_key(query_text: str, query_type: str, filters: Dict) -> tuple:
+    return (query_text, query_type, tuple(sorted((filters or {}).items())))
+
+def _copy_processed(processed: Dict) -> Dict:
+    copied = dict(processed)
+    copied['data'] = list(processed['data'])
+    copied['evidence'] = list(processed['evidence'])
+    return copied
+
+def _get_cached_query(key: tuple) -> Dict:
+    with _QUERY_CACHE_LOCK:
+        entry = _QUERY_CACHE.get(key)
+        if entry and time.time() - entry[0] < QUERY_CACHE_TTL:
+            return _copy_processed(entry[1])
+    return None
+
+def _store_cached_query(key: tuple, processed: Dict):
+    with _QUERY_CACHE_LOCK:
+        _QUERY_CACHE[key] = (time.time(), _copy_processed(processed))
+        _QUERY_CACHE.move_to_end(key)
+        while len(_QUERY_CACHE) > QUERY_CACHE_MAX_ENTRIES:
+            _QUERY_CACHE.popitem(last=False)
+
+def _store_cached_answer(key: tuple, answer_future, answer: Optional[str]):
+    """Fill in the summary of the cache entry that answer_future was started for"""
+    with _QUERY_CACHE_LOCK:
+        entry = _QUERY_CACHE.get(key)
+        if entry and entry[1].get('answer_future') is answer_future:
+            _QUERY_CACHE[key] = (entry[0], dict(entry[1], answer=answer, answer_future=None))
+
+def _answer_in_background(query_text: str, data: List[Dict], vec_future=None):
+    """Runs on _IO_POOL: LLM answer from the processed results and vector passages"""
+    try:
+        vector_passages = vec_future.result() if vec_future else []
+        return generator.generate_answer(query_text, data, vector_passages)
+    except Exception as e:
+        logger.error(f"LLM generation failed: {e}")
+        return None
+
+def render_summary(placeholder, answer: str = None, generating: bool = False):
+    """Fill the AI summary slot (empty when there is no answer)"""
+    if not answer and not generating:
+        placeholder.empty()
+        return
+    with placeholder.container():
+        st.subheader("💡 AI-Generated Summary")
+        st.info(answer if answer else "⏳ Generating summary...")
+        st.markdown("---")
+
+def _quick_query_type(query_text: str) -> Optional[str]:
+    for pattern, query_type in _QUICK_PATTERNS:
+        if pattern.match(query_text):
+            return query_type
+    return None
+
+def execute_query(query_text: str = None, query_type: str = None, filters: Dict = None,
+                  graph_results: List[Dict] = None):
     """
     Execute query and update session state - COMPLETELY FIXED
+    Pass graph_results (e.g. prefetched preset results) to skip graph retrieval
     """
     with st.spinner("🔍 Searching database..."):
-        # Classify query if needed
+        # Classify query if needed (trivial queries bypass the classifier)
+        quick_type = None
         if query_text and not query_type:
-            query_type = classifier.classify(query_text)
+            quick_type = _quick_query_type(query_text)
+            query_type = quick_type or _classify(query_text)
+        
+        # Query text for the LLM summary (None: no vector search, no answer)
+        answer_text = None if quick_type in _SKIP_LLM else query_text
         
         st.session_state.current_query_type = query_type
+        st.session_state.pending_answer = None
         
         # DEBUG: Show what we're querying
         logger.info(f"🔍 Executing query: type={query_type}, filters={filters}")
         
-        # Retrieve from graph
-        graph_results = retriever.retrieve_from_graph(query_type, filters or {})
+        # Same query re-run (preset re-clicked, filters re-applied): skip the
+        # whole retrieval / guardrails / LLM pipeline
+        cache_key = _query_cache_key(query_text, query_type, filters)
+        cached = _get_cached_query(cache_key)
+        if cached is not None:
+            st.session_state.pending_graph = None
+            st.session_state.current_results = cached['data']
+            st.session_state.current_evidence = cached['evidence']
+            st.session_state.current_answer = cached.get('answer')
+            st.session_state.current_warning = cached.get('warning')
+            if cached.get('answer') is None and cached.get('answer_future') is not None:
+                # First run's summary not filled in yet: wait for it like that run does
+                st.session_state.pending_answer = {
+                    'future': cached['answer_future'],
+                    'cache_key': cache_key
+                }
+            logger.info(f"✅ Query served from cache: {len(cached['data'])} results")
+            return
         
-        # DEBUG: Log raw results
-        logger.info(f"📊 Raw results from graph: {len(graph_results)}")
+        # Vector passages are only needed for the LLM answer; fetch them in the
+        # background while the graph query runs
+        vec_future = _IO_POOL.submit(retriever.retrieve_from_vector, answer_text) if answer_text else None
+        
+        if graph_results is not None:
+            st.session_state.pending_graph = None
+            finish_query(graph_results, answer_text, query_type, vec_future, cache_key)
+            return
+        
+        # Retrieve from graph, waiting only briefly: a slow query finishes in the
+        # background and its results are picked up on a later rerun
+        graph_future = _SLOW_POOL.submit(retriever.retrieve_from_graph, query_type, filters or {})
+        st.session_state.pending_graph = None
+        try:
+            graph_results = graph_future.result(timeout=GRAPH_WAIT_SECONDS)
+        except FutureTimeoutError:
+            st.session_state.pending_graph = {
+                'future': graph_future,
+                'query_text': answer_text,
+                'query_type': query_type,
+                'vec_future': vec_future,
+                'cache_key': cache_key
+            }
+            st.session_state.current_results = None
+            st.session_state.current_evidence = []
+            st.session_state.current_answer = None
+            st.session_state.current_warning = None
+            logger.info(f"⏳ Graph query still running, finishing in background: type={query_type}")
+            return
         
+        finish_query(graph_results, answer_text, query_type, vec_future, cache_key)
+
+def finish_query(graph_results: List[Dict], query_text: str, query_type: str, vec_future=None,
+                 cache_key: tuple = None):
+    """
+    Post-process graph results (dedupe, corroborate, guardrails, answer) into session state
+    """
+    with st.spinner("🔍 Preparing results..."):
         # CRITICAL FIX: Check if we have results BEFORE deduplication
-        if not graph_results or len(graph_results) == 0:
+        if not graph_results:
             st.session_state.current_results = []
             st.session_state.current_evidence = []
             st.session_state.current_answer = None
             st.session_state.current_warning = f"⚠️ No data found for query type '{query_type}'. Database has data but query returned nothing."
             logger.warning(f"❌ No results from query_type={query_type}")
+            if vec_future:
+                vec_future.cancel()
             return
         
+        # DEBUG: Log raw results
+        logger.info(f"📊 Raw results from graph: {len(graph_results)}")
+        
         # Deduplicate with fixed logic
-        deduplicated = deduplicate_results(graph_results)
+        deduplicated = _dedupe(graph_results)
         
         # DEBUG: Log after deduplication
         logger.info(f"📊 After deduplication: {len(deduplicated)} results")
         
         # CRITICAL FIX: Check again after deduplication with better message
-        if not deduplicated or len(deduplicated) == 0:
+        if not deduplicated:
             st.session_state.current_results = []
             st.session_state.current_evidence = []
             st.session_state.current_answer = None
             st.session_state.current_warning = f"⚠️ Found {len(graph_results)} results but all were filtered as duplicates. Try adjusting filters."
             logger.warning(f"❌ All {len(graph_results)} results filtered during deduplication")
+            if vec_future:
+                vec_future.cancel()
             return
         
         # Corroborate evidence
@@ -235,15 +533,18 @@ def execute_query(query_text: str = None, query_type: str = None, filters: Dict
         # DEBUG: Log final processed count
         logger.info(f"📊 Final processed: {len(processed['data'])} results")
         
-        # Generate answer if LLM available
-        if query_text and len(processed['data']) > 0:
-            try:
-                vector_passages = retriever.retrieve_from_vector(query_text)
-                answer = generator.generate_answer(query_text, processed['data'], vector_passages)
-                processed['answer'] = answer
-            except Exception as e:
-                logger.error(f"LLM generation failed: {e}")
-                processed['answer'] = None
+        # Generate answer if LLM available, in the background: the results
+        # table renders first and the summary is filled in when it is ready
+        processed['answer'] = None
+        processed['answer_future'] = None
+        if query_text and processed['data']:
+            # Kept on the cache entry too: a repeat of this query before the
+            # answer is in waits on the same future
+            processed['answer_future'] = _IO_POOL.submit(_answer_in_background, query_text, processed['data'], vec_future)
+            st.session_state.pending_answer = {
+                'future': processed['answer_future'],
+                'cache_key': cache_key
+            }
         
         # Update session state
         st.session_state.current_results = processed['data']
@@ -251,37 +552,74 @@ def execute_query(query_text: str = None, query_type: str = None, filters: Dict
         st.session_state.current_answer = processed.get('answer')
         st.session_state.current_warning = processed.get('warning')
         
+        if cache_key is not None:
+            _store_cached_query(cache_key, processed)
+        
         logger.info(f"✅ Query complete: {len(processed['data'])} results, {len(processed['evidence'])} evidence items")
 
+# Pick up a graph query that outlived the interactive wait
+if st.session_state.pending_graph and st.session_state.pending_graph['future'].done():
+    pending = st.session_state.pending_graph
+    st.session_state.pending_graph = None
+    try:
+        graph_results = pending['future'].result()
+    except Exception as e:
+        logger.error(f"Graph retrieval failed: {e}")
+        graph_results = []
+    finish_query(graph_results, pending['query_text'], pending['query_type'], pending['vec_future'],
+                 pending['cache_key'])
+
 # Header
 st.markdown('<div class="main-header">🏭 Motherson Intelligence Platform</div>', unsafe_allow_html=True)
 st.markdown('<div class="sub-header">AI-Powered India Facility Intelligence with Evidence-Based Insights</div>', unsafe_allow_html=True)
 
-# Sidebar - Filters
-with st.sidebar:
+# Sidebar - Filters (widget values are read back from st.session_state by key)
+def current_filters() -> Dict:
+    """Build the query filters dict from the sidebar widgets."""
+    date_from = st.session_state.date_from
+    date_to = st.session_state.date_to
+    return {
+        'division': None if st.session_state.division_filter == "All" else st.session_state.division_filter,
+        'state': None if st.session_state.state_filter == "All" else st.session_state.state_filter,
+        'status': None if st.session_state.status_filter == "All" else st.session_state.status_filter,
+        'date_from': date_from.isoformat() if date_from else None,
+        'date_to': date_to.isoformat() if date_to else None
+    }
+
+def default_filters() -> Dict:
+    """The filters dict for the sidebar widgets' initial values"""
+    today = datetime.now().date()
+    return {
+        'division': None,
+        'state': None,
+        'status': None,
+        'date_from': (today - timedelta(days=_DEFAULT_DATE_RANGE_DAYS)).isoformat(),
+        'date_to': today.isoformat()
+    }
+
+@fragment
+def sidebar():
     st.header("🔍 Filters")
     st.markdown("---")
     
     # Division filter
-    division_filter = st.selectbox(
+    st.selectbox(
         "Division",
-        ["All", "Wiring Systems", "Vision Systems", "Seating Systems", "Polymers", "Logistics"],
+        _DIVISION_OPTIONS,
         key="division_filter"
     )
     
     # State filter
-    state_filter = st.selectbox(
+    st.selectbox(
         "State (India)",
-        ["All", "Gujarat", "Tamil Nadu", "Maharashtra", "Haryana", "Karnataka",
-         "Uttar Pradesh", "Rajasthan", "Punjab", "Telangana", "Andhra Pradesh",
-         "West Bengal", "Madhya Pradesh", "Kerala", "Odisha", "Uttarakhand"],
+        _STATE_OPTIONS,
         key="state_filter"
     )
     
     # Status filter
-    status_filter = st.selectbox(
+    st.selectbox(
         "Status",
-        ["All", "operational", "under-construction", "planned"],
+        _STATUS_OPTIONS,
         key="status_filter"
     )
     
@@ -291,13 +629,13 @@ with st.sidebar:
     st.subheader("📅 Date Range")
     col1, col2 = st.columns(2)
     with col1:
-        date_from = st.date_input(
+        st.date_input(
             "From",
-            value=datetime.now() - timedelta(days=730),
+            value=datetime.now() - timedelta(days=_DEFAULT_DATE_RANGE_DAYS),
             key="date_from"
         )
     with col2:
-        date_to = st.date_input(
+        st.date_input(
             "To",
             value=datetime.now(),
             key="date_to"
@@ -308,45 +646,116 @@ with st.sidebar:
     # Apply filters button
     if st.button("✅ Apply Filters", use_container_width=True, type="primary"):
         if st.session_state.current_query_type:
-            filters = {
-                'division': None if division_filter == "All" else division_filter,
-                'state': None if state_filter == "All" else state_filter,
-                'status': None if status_filter == "All" else status_filter,
-                'date_from': date_from.isoformat() if date_from else None,
-                'date_to': date_to.isoformat() if date_to else None
-            }
-            execute_query(query_type=st.session_state.current_query_type, filters=filters)
+            execute_query(query_type=st.session_state.current_query_type, filters=current_filters())
+            refresh_page()
         else:
             st.warning("Please run a query first!")
 
-# Build filters dict
-filters = {
-    'division': None if division_filter == "All" else division_filter,
-    'state': None if state_filter == "All" else state_filter,
-    'status': None if status_filter == "All" else status_filter,
-    'date_from': date_from.isoformat() if date_from else None,
-    'date_to': date_to.isoformat() if date_to else None
-}
+with st.sidebar:
+    sidebar()
 
-# Main content - Search section
-st.subheader("🔎 Search Query")
+filters = current_filters()
 
-col1, col2 = st.columns([4, 1])
+# Prefetch the preset query results for the default filters in one batched
+# retriever call, in the background, so clicking a preset button skips graph
+# retrieval. Other filter combinations are not prefetched (a sidebar change
+# would otherwise fire three graph queries). Results are pickled to CACHE_DIR
+# (same values as a live query), keyed by the data version, so they survive
+# app restarts; only the latest file is kept. st.cache_data is not used: it
+# neither reads nor writes outside the script thread
+PRESET_QUERY_TYPES = ("list_facilities", "new_expansions", "hiring_positions")
 
-with col1:
-    custom_query = st.text_input(
-        "Enter your query about Motherson India facilities",
-        placeholder="e.g., Show wiring facilities in Gujarat with expansion plans",
-        label_visibility="collapsed",
-        key="custom_query"
-    )
+@st.cache_data(ttl=60, show_spinner=False)
+def _data_version() -> str:
+    """Version written by the ingestion pipeline (run.py), else the graph DB's mtime"""
+    try:
+        return DATA_VERSION_PATH.read_text().strip()
+    except OSError:
+        pass
+    try:
+        return f"db-{os.path.getmtime(DB_PATH)}"
+    except OSError:
+        return ""
 
-with col2:
-    if st.button("🔍 Search", use_container_width=True, type="primary"):
-        if custom_query:
-            execute_query(query_text=custom_query, filters=filters)
-        else:
-            st.warning("Please enter a query!")
+def _prefetch_presets(filters_key: tuple, data_version: str) -> Dict[str, List[Dict]]:
+    key_hash = hashlib.md5(repr((filters_key, data_version)).encode()).hexdigest()
+    cache_path = CACHE_DIR / f"presets_{key_hash}.pkl"
+    try:
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+    
+    preset_filters = dict(filters_key)
+    batch = retriever.retrieve_from_graph_batch([(qt, preset_filters) for qt in PRESET_QUERY_TYPES])
+    results = dict(zip(PRESET_QUERY_TYPES, batch))
+    try:
+        # Earlier days' default date ranges and older data versions
+        for old_path in CACHE_DIR.glob("presets_*"):
+            old_path.unlink(missing_ok=True)
+        with open(cache_path, 'wb') as f:
+            pickle.dump(results, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        logger.warning(f"Preset cache write error: {e}")
+    return results
+
+# Prefetch future for the current default filters and data version (one per process)
+@st.cache_resource
+def init_preset_prefetch():
+    return {}
+
+_PRESET_PREFETCH = init_preset_prefetch()
+
+def get_preset_results(filters: Dict) -> Dict[str, List[Dict]]:
+    """Prefetched preset results; {} for non-default filters or while still running"""
+    if filters != default_filters():
+        return {}
+    
+    key = (tuple(sorted(filters.items())), _data_version())
+    future = _PRESET_PREFETCH.get(key)
+    timeout = 0
+    if future is None:
+        # New day (default dates) or new data: drop the old prefetch. The first
+        # rerun waits briefly, enough for results already stored on disk
+        _PRESET_PREFETCH.clear()
+        future = _PRESET_PREFETCH[key] = _SLOW_POOL.submit(_prefetch_presets, *key)
+        timeout = GRAPH_WAIT_SECONDS
+    
+    try:
+        return future.result(timeout=timeout)
+    except FutureTimeoutError:
+        return {}
+    except Exception as e:
+        logger.error(f"Preset prefetch failed: {e}")
+        _PRESET_PREFETCH.pop(key, None)  # Retry on a later rerun
+        return {}
+
+preset_results = get_preset_results(filters)
+
+# Main content - Search section
+@fragment
+def search_bar():
+    st.subheader("🔎 Search Query")
+    
+    col1, col2 = st.columns([4, 1])
+    
+    with col1:
+        custom_query = st.text_input(
+            "Enter your query about Motherson India facilities",
+            placeholder="e.g., Show wiring facilities in Gujarat with expansion plans",
+            label_visibility="collapsed",
+            key="custom_query"
+        )
+    
+    with col2:
+        if st.button("🔍 Search", use_container_width=True, type="primary"):
+            if custom_query:
+                execute_query(query_text=custom_query, filters=current_filters())
+                refresh_page()
+            else:
+                st.warning("Please enter a query!")
+
+search_bar()
 
 # Preset query buttons
 st.subheader("📋 Preset Queries")
@@ -362,7 +771,8 @@ with col1:
         execute_query(
             query_text="List all Motherson India facilities by division with location and status",
             query_type="list_facilities",
-            filters=filters
+            filters=filters,
+            graph_results=preset_results.get("list_facilities")
         )
 
 with col2:
@@ -375,7 +785,8 @@ with col2:
         execute_query(
             query_text="Show new or expanded plants in India in the last 24 months",
             query_type="new_expansions",
-            filters=filters
+            filters=filters,
+            graph_results=preset_results.get("new_expansions")
         )
 
 with col3:
@@ -388,154 +799,142 @@ with col3:
         execute_query(
             query_text="Show hiring positions for factory roles in India",
             query_type="hiring_positions",
-            filters=filters
+            filters=filters,
+            graph_results=preset_results.get("hiring_positions")
         )
 
 # Display results
-if st.session_state.current_results is not None:
-    st.markdown("---")
+@fragment
+def results():
+    if st.session_state.pending_graph:
+        st.info("⏳ Still querying the database, results will appear here automatically")
+
+    if st.session_state.current_results is not None:
+        st.markdown("---")
     
-    # Show warning if any
-    if st.session_state.current_warning:
-        st.warning(st.session_state.current_warning)
+        # Show warning if any
+        if st.session_state.current_warning:
+            st.warning(st.session_state.current_warning)
     
-    # LLM Answer
-    if st.session_state.current_answer:
-        st.subheader("💡 AI-Generated Summary")
-        st.info(st.session_state.current_answer)
-        st.markdown("---")
+        # LLM Answer (placeholder while it is still being generated)
+        summary_placeholder = st.empty()
+        render_summary(summary_placeholder, st.session_state.current_answer,
+                       generating=bool(st.session_state.pending_answer))
     
-    # Results table
-    st.subheader("📊 Results")
+        # Results table
+        st.subheader("📊 Results")
     
-    # Show count even if 0
-    result_count = len(st.session_state.current_results) if st.session_state.current_results else 0
-    logger.info(f"🖥️ Displaying {result_count} results to user")
+        # Show count even if 0
+        result_count = len(st.session_state.current_results or ())
+        logger.info(f"🖥️ Displaying {result_count} results to user")
     
-    if result_count > 0:
-        # Create DataFrame based on query type
-        if st.session_state.current_query_type == "list_facilities":
-            df_data = []
-            for idx, result in enumerate(st.session_state.current_results):
-                df_data.append({
-                    'Division': result.get('division', 'N/A'),
-                    'Facility': result.get('facility') or result.get('name', 'N/A'),
-                    'Location': format_location(result.get('city'), result.get('state')),
-                    'Status': result.get('status', 'N/A'),
-                    'First Date': result.get('first_date') or result.get('last_event_date', 'N/A'),
-                    'Confidence': result.get('confidence', 0.9),
-                    'Citation': f'<a href="#ev-{idx}" class="citation">[{idx + 1}]</a>'
-                })
-            
-            df = pd.DataFrame(df_data)
-            df['Confidence'] = df['Confidence'].apply(
-                lambda x: get_confidence_badge(x) if isinstance(x, (int, float)) else x
-            )
-            st.markdown(df.to_html(escape=False, index=False), unsafe_allow_html=True)
+        if result_count > 0:
+            # Create DataFrame based on query type
+            results_df = pd.DataFrame(st.session_state.current_results)
+            df = None
         
-        elif st.session_state.current_query_type == "new_expansions":
-            df_data = []
-            for idx, result in enumerate(st.session_state.current_results):
-                df_data.append({
-                    'Facility': result.get('facility', 'N/A'),
-                    'Division': result.get('division', 'N/A'),
-                    'Type': result.get('expansion_type', 'N/A'),
-                    'Location': format_location(result.get('city'), result.get('state')),
-                    'Timeline': result.get('timeline') or result.get('event_date', 'N/A'),
-                    'Confidence': result.get('confidence', 0.8),
-                    'Citation': f'<a href="#ev-{idx}" class="citation">[{idx + 1}]</a>'
+            if st.session_state.current_query_type == "list_facilities":
+                df = pd.DataFrame({
+                    'Division': _pick(results_df, 'division'),
+                    'Facility': _pick(results_df, 'facility', 'name'),
+                    'Location': _location_column(results_df),
+                    'Status': _pick(results_df, 'status'),
+                    'First Date': _pick(results_df, 'first_date', 'last_event_date'),
+                    'Confidence': _confidence_column(results_df, 0.9),
+                    'Citation': _citation_column(results_df)
                 })
-            
-            df = pd.DataFrame(df_data)
-            df['Confidence'] = df['Confidence'].apply(
-                lambda x: get_confidence_badge(x) if isinstance(x, (int, float)) else x
-            )
-            st.markdown(df.to_html(escape=False, index=False), unsafe_allow_html=True)
         
-        elif st.session_state.current_query_type == "hiring_positions":
-            df_data = []
-            for idx, result in enumerate(st.session_state.current_results):
-                df_data.append({
-                    'Job Title': result.get('title', 'N/A'),
-                    'Location': result.get('location', 'N/A'),
-                    'Facility': result.get('facility', 'N/A'),
-                    'Division': result.get('division', 'N/A'),
-                    'Factory Role': '✓' if result.get('is_factory_role') else '✗',
-                    'Citation': f'<a href="#ev-{idx}" class="citation">[{idx + 1}]</a>'
+            elif st.session_state.current_query_type == "new_expansions":
+                df = pd.DataFrame({
+                    'Facility': _pick(results_df, 'facility'),
+                    'Division': _pick(results_df, 'division'),
+                    'Type': _pick(results_df, 'expansion_type'),
+                    'Location': _location_column(results_df),
+                    'Timeline': _pick(results_df, 'timeline', 'event_date'),
+                    'Confidence': _confidence_column(results_df, 0.8),
+                    'Citation': _citation_column(results_df)
                 })
-            
-            df = pd.DataFrame(df_data)
-            st.markdown(df.to_html(escape=False, index=False), unsafe_allow_html=True)
         
-        # Summary statistics
-        st.markdown("---")
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("📊 Total Results", len(st.session_state.current_results))
-        
-        with col2:
-            if st.session_state.current_query_type == "list_facilities":
-                divisions = set(r.get('division', 'N/A') for r in st.session_state.current_results if r.get('division'))
-                st.metric("🏢 Divisions", len(divisions))
-            elif st.session_state.current_query_type == "new_expansions":
-                greenfield = sum(1 for r in st.session_state.current_results if r.get('expansion_type') == 'greenfield')
-                st.metric("🌱 Greenfield", greenfield)
             elif st.session_state.current_query_type == "hiring_positions":
-                factory_roles = sum(1 for r in st.session_state.current_results if r.get('is_factory_role'))
-                st.metric("🏭 Factory Roles", factory_roles)
+                factory_role = _column(results_df, 'is_factory_role').fillna(False).astype(bool)
+                df = pd.DataFrame({
+                    'Job Title': _pick(results_df, 'title'),
+                    'Location': _pick(results_df, 'location'),
+                    'Facility': _pick(results_df, 'facility'),
+                    'Division': _pick(results_df, 'division'),
+                    'Factory Role': factory_role,
+                    'Citation': _citation_column(results_df)
+                })
         
-        with col3:
-            if st.session_state.current_query_type in ["list_facilities", "new_expansions"]:
-                operational = sum(1 for r in st.session_state.current_results if r.get('status') == 'operational')
-                st.metric("✅ Operational", operational)
-            else:
-                locations = set(r.get('location', 'N/A') for r in st.session_state.current_results if r.get('location'))
-                st.metric("📍 Locations", len(locations))
+            if df is not None:
+                st.dataframe(df, use_container_width=True, hide_index=True, column_config=RESULT_COLUMN_CONFIG)
         
-        with col4:
-            confidences = [r.get('confidence', 0) for r in st.session_state.current_results]
-            avg_conf = sum(confidences) / len(confidences) if confidences else 0
-            st.metric("🎯 Avg Confidence", f"{avg_conf:.2f}")
+            # Summary statistics (column aggregations over the results frame built above)
+            st.markdown("---")
+            for col, metric in zip(st.columns(4), _summary_metrics(results_df, st.session_state.current_query_type)):
+                if metric is not None:
+                    with col:
+                        st.metric(*metric)
         
-    else:
-        # BETTER ERROR MESSAGE
-        st.error(f"""
-        🔍 **No results found for query type: {st.session_state.current_query_type}**
+        else:
+            # BETTER ERROR MESSAGE
+            st.error(f"""
+            🔍 **No results found for query type: {st.session_state.current_query_type}**
         
-        **Possible reasons:**
-        1. No data in database matches your filters
-        2. Try Query 1 first (List All Facilities) to see what data exists
-        3. Check if ingestion pipeline completed successfully
-        4. Try removing filters in the sidebar
+            **Possible reasons:**
+            1. No data in database matches your filters
+            2. Try Query 1 first (List All Facilities) to see what data exists
+            3. Check if ingestion pipeline completed successfully
+            4. Try removing filters in the sidebar
         
-        **Debug Info:**
-        - Query Type: {st.session_state.current_query_type}
-        - Applied Filters: {filters}
-        """)
+            **Debug Info:**
+            - Query Type: {st.session_state.current_query_type}
+            - Applied Filters: {current_filters()}
+            """)
     
-    # Evidence viewer
-    if len(st.session_state.current_evidence) > 0:
-        st.markdown("---")
-        st.subheader("📄 Evidence & Citations")
-        st.caption("Click on citations in the table above to jump to highlighted evidence")
+        # Evidence viewer
+        if st.session_state.current_evidence:
+            st.markdown("---")
+            st.subheader("📄 Evidence & Citations")
+            st.caption("Citation numbers in the results table match the evidence entries below")
         
-        for idx, evidence in enumerate(st.session_state.current_evidence):
-            with st.expander(f"**[{idx + 1}]** {evidence.get('title', 'Evidence')} - {evidence.get('source_type', 'Document')}"):
-                # Source metadata
-                st.markdown(f"**🔗 URL:** [{evidence.get('url', 'N/A')}]({evidence.get('url', '#')})")
-                st.markdown(f"**📅 Date:** {evidence.get('date', 'N/A')}")
-                st.markdown(f"**📊 Confidence:** {get_confidence_badge(evidence.get('confidence', 0.7))}", unsafe_allow_html=True)
-                
-                st.markdown("**📝 Evidence Snippet:**")
-                
-                # Display text
-                text = evidence.get('text', '')
-                st.markdown(f'<div class="evidence-box" id="ev-{idx}">{text}</div>', unsafe_allow_html=True)
+            # One metadata table plus a single detail pane for the selected
+            # entry, instead of an expander (and its markdown) per evidence item
+            evidence = st.session_state.current_evidence
+            evidence_df = pd.DataFrame(evidence)
+            st.dataframe(pd.DataFrame({
+                'Citation': _citation_column(evidence_df),
+                'Title': _pick(evidence_df, 'title', default='Evidence'),
+                'Source': _pick(evidence_df, 'source_type', default='Document'),
+                'Date': _pick(evidence_df, 'date'),
+                'Confidence': _confidence_column(evidence_df, 0.7),
+                'URL': _column(evidence_df, 'url')
+            }), use_container_width=True, hide_index=True, column_config=EVIDENCE_COLUMN_CONFIG)
+            
+            idx = st.selectbox(
+                "📝 Evidence Snippet",
+                range(len(evidence)),
+                format_func=lambda i: f"[{i + 1}] {evidence[i].get('title', 'Evidence')}"
+            )
+            selected = evidence[idx]
+            st.markdown(f"**📊 Confidence:** {get_confidence_badge(selected.get('confidence', 0.7))}", unsafe_allow_html=True)
+            st.markdown(f'<div class="evidence-box" id="ev-{idx}">{selected.get("text", "")}</div>', unsafe_allow_html=True)
+    
+        # Page is rendered: now wait for the LLM summary and fill it in
+        if st.session_state.pending_answer:
+            pending = st.session_state.pending_answer
+            st.session_state.pending_answer = None
+            answer = pending['future'].result()
+            if pending['cache_key'] is not None:
+                _store_cached_answer(pending['cache_key'], pending['future'], answer)
+            st.session_state.current_answer = answer
+            render_summary(summary_placeholder, answer)
+
+    else:
+        # Initial state - welcome message
+        st.info("👆 Click on a preset query button or enter a custom query to get started")
 
-else:
-    # Initial state - welcome message
-    st.info("👆 Click on a preset query button or enter a custom query to get started")
+results()
 
 st.markdown("---")
 st.subheader("ℹ️ About this Platform")
@@ -565,4 +964,9 @@ This platform provides AI-powered intelligence on **Motherson India's** faciliti
 
 # Footer
 st.markdown("---")
-st.caption("Motherson Intelligence Platform | Powered by Agentic RAG & NLP | India Focus | Data refreshed: " + datetime.now().strftime("%Y-%m-%d %H:%M"))
\ No newline at end of file
+st.caption("Motherson Intelligence Platform | Powered by Agentic RAG & NLP | India Focus | Data refreshed: " + datetime.now().strftime("%Y-%m-%d %H:%M"))
+
+# Poll a background graph query: rerun until it is done
+if st.session_state.pending_graph:
+    time.sleep(GRAPH_POLL_SECONDS)
+    st.rerun()
\ No newline at end of file